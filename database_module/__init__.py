@@ -11,7 +11,7 @@ __version__ = "1.0.0"
 __author__ = "🍀☀🌕🌥 🌊"
 
 from database_module.core.database_types import DatabaseType
-from database_module.core.database_base import DatabaseBase, DatabaseValue, DatabaseRow, DatabaseResult
+from database_module.core.database_base import DatabaseBase, DatabaseValue, DatabaseRow, DatabaseResult, DatabaseColumns, ResultRow
 from database_module.core.database_manager import DatabaseManager
 
 # Convenience exports
@@ -26,6 +26,8 @@ __all__ = [
     "DatabaseValue",
     "DatabaseRow",
     "DatabaseResult",
+    "DatabaseColumns",
+    "ResultRow",
     "DatabaseManager",
 
     # Backends
@@ -4,14 +4,106 @@ PostgreSQL database manager implementation.
 Equivalent to C++ database/postgres_manager.h/cpp
 """
 
-from typing import Optional
+import datetime
+import decimal
+import io
+import itertools
+import logging
+import re
+import uuid
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 import psycopg2
+import psycopg2.errors
 import psycopg2.extras
 from psycopg2 import sql
 
-from database_module.core.database_base import DatabaseBase, DatabaseResult
+from database_module.core.database_base import (
+    DatabaseBase,
+    DatabaseColumns,
+    DatabaseResult,
+    DatabaseRow,
+    DatabaseValue,
+    ResultRow,
+)
 from database_module.core.database_types import DatabaseType
 
+_log = logging.getLogger(__name__)
+
+# Matches psycopg2 positional placeholders and escaped percent signs
+_PLACEHOLDER_RE = re.compile(r"%%|%s")
+
+
+def _to_positional(query_string: str) -> str:
+    """Rewrite psycopg2 ``%s`` placeholders to PostgreSQL ``$n`` parameters."""
+    counter = itertools.count(1)
+    return _PLACEHOLDER_RE.sub(
+        lambda match: "%" if match.group() == "%%" else f"${next(counter)}",
+        query_string,
+    )
+
+
+# Parameter types psycopg2 adapts to a single value, so they can be bound to a
+# PREPARE parameter. Anything else (e.g. a tuple for "IN %s", which expands to
+# a parenthesized list) only works as plain text and bypasses the cache.
+_PREPARABLE_TYPES = (
+    str,
+    int,
+    float,
+    bytes,
+    type(None),
+    decimal.Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    uuid.UUID,
+)
+
+# Composed SQL strings kept per connection by compose()
+_COMPOSE_CACHE_SIZE = 512
+
+# Characters that must be backslash-escaped in COPY text format
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_text(value: DatabaseValue) -> str:
+    """Encode a value as a COPY text-format field."""
+    if value is None:
+        return "\\N"
+    if value is True:
+        return "t"
+    if value is False:
+        return "f"
+    if isinstance(value, str):
+        return value.translate(_COPY_ESCAPES)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # bytea hex format; COPY itself needs the backslash doubled
+        return "\\\\x" + bytes(value).hex()
+    return str(value)
+
+
+# Result column names and the name -> position index shared by ResultRow views
+_ResultLayout = Tuple[Tuple[str, ...], Dict[str, int]]
+
+
+def _describe(description) -> _ResultLayout:
+    """Build the result layout from a cursor description."""
+    columns = tuple(column.name for column in description)
+    index = {name: position for position, name in enumerate(columns)}
+    return columns, index
+
+
+class _PreparedStatement:
+    """Statement cache entry: server-side name plus its result layout."""
+
+    __slots__ = ("name", "layout")
+
+    def __init__(self, name: Optional[str]):
+        # None if PREPARE failed, so the query always runs unprepared
+        self.name = name
+        # Filled from cursor.description on the first SELECT through it
+        self.layout: Optional[_ResultLayout] = None
+
 
 class PostgresManager(DatabaseBase):
     """
@@ -23,10 +115,36 @@ class PostgresManager(DatabaseBase):
     using psycopg2 driver.
     """
 
-    def __init__(self):
-        """Initialize PostgreSQL manager."""
+    def __init__(self, statement_cache_size: int = 256, dict_rows: bool = False):
+        """
+        Initialize PostgreSQL manager.
+
+        Args:
+            statement_cache_size: Maximum number of server-side prepared statements
+                                  kept per connection. Use 0 to disable the cache,
+                                  e.g. behind pgbouncer in transaction pooling mode
+                                  (pass it through DatabaseManager.set_mode() or
+                                  ConnectionPoolConfig.backend_options).
+            dict_rows: Return rows as plain dicts instead of ResultRow views,
+                       for callers that mutate rows or serialize them
+                       (e.g. json.dumps). Also reachable through
+                       set_mode() and ConnectionPoolConfig.backend_options.
+        """
         self._connection: Optional[psycopg2.extensions.connection] = None
         self._cursor: Optional[psycopg2.extensions.cursor] = None
+        self._dict_rows = dict_rows
+        self._autocommit = True
+
+        # Prepared statement cache: SQL text -> statement entry (LRU order)
+        self._statement_cache_size = statement_cache_size
+        self._stmt_cache: OrderedDict[str, _PreparedStatement] = OrderedDict()
+        self._stmt_counter = 0
+        self._cursor_counter = 0
+        # Names dropped from the cache whose server-side statement still exists
+        self._stale_statements: List[str] = []
+
+        # Composed SQL cache: (template, identifiers) -> SQL string (LRU order)
+        self._compose_cache: OrderedDict[Tuple[str, Tuple[str, ...]], str] = OrderedDict()
 
     def __del__(self):
         """Destructor - ensure connection is closed."""
@@ -48,19 +166,25 @@ class PostgresManager(DatabaseBase):
             True if connected successfully.
         """
         try:
+            self._stmt_cache.clear()
+            self._stale_statements.clear()
+            self._compose_cache.clear()
             self._connection = psycopg2.connect(connect_string)
-            self._cursor = self._connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            self._cursor = self._connection.cursor()
             return True
         except (Exception, psycopg2.Error) as error:
-            print(f"Error connecting to PostgreSQL: {error}")
+            _log.error("Error connecting to PostgreSQL: %s", error)
             return False
 
-    def create_query(self, query_string: str) -> bool:
+    def create_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> bool:
         """
         Execute DDL query (CREATE, DROP, ALTER).
 
         Args:
             query_string: DDL SQL statement
+            params: Optional values for %s placeholders in query_string
 
         Returns:
             True if executed successfully.
@@ -69,20 +193,24 @@ class PostgresManager(DatabaseBase):
             return False
 
         try:
-            self._cursor.execute(query_string)
-            self._connection.commit()
+            self._cursor.execute(query_string, params)
+            if self._autocommit:
+                self._connection.commit()
             return True
         except (Exception, psycopg2.Error) as error:
-            print(f"Error executing query: {error}")
+            _log.error("Error executing query: %s", error)
             self._connection.rollback()
             return False
 
-    def insert_query(self, query_string: str) -> int:
+    def insert_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> int:
         """
         Execute INSERT query.
 
         Args:
             query_string: SQL INSERT statement
+            params: Optional values for %s placeholders in query_string
 
         Returns:
             Number of rows inserted (rowcount).
@@ -91,20 +219,24 @@ class PostgresManager(DatabaseBase):
             return 0
 
         try:
-            self._cursor.execute(query_string)
-            self._connection.commit()
+            self._execute_cached(query_string, params)
+            if self._autocommit:
+                self._connection.commit()
             return self._cursor.rowcount if self._cursor.rowcount else 0
         except (Exception, psycopg2.Error) as error:
-            print(f"Error inserting data: {error}")
+            _log.error("Error inserting data: %s", error)
             self._connection.rollback()
             return 0
 
-    def update_query(self, query_string: str) -> int:
+    def update_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> int:
         """
         Execute UPDATE query.
 
         Args:
             query_string: SQL UPDATE statement
+            params: Optional values for %s placeholders in query_string
 
         Returns:
             Number of rows updated.
@@ -113,20 +245,24 @@ class PostgresManager(DatabaseBase):
             return 0
 
         try:
-            self._cursor.execute(query_string)
-            self._connection.commit()
+            self._execute_cached(query_string, params)
+            if self._autocommit:
+                self._connection.commit()
             return self._cursor.rowcount if self._cursor.rowcount else 0
         except (Exception, psycopg2.Error) as error:
-            print(f"Error updating data: {error}")
+            _log.error("Error updating data: %s", error)
             self._connection.rollback()
             return 0
 
-    def delete_query(self, query_string: str) -> int:
+    def delete_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> int:
         """
         Execute DELETE query.
 
         Args:
             query_string: SQL DELETE statement
+            params: Optional values for %s placeholders in query_string
 
         Returns:
             Number of rows deleted.
@@ -135,43 +271,139 @@ class PostgresManager(DatabaseBase):
             return 0
 
         try:
-            self._cursor.execute(query_string)
-            self._connection.commit()
+            self._execute_cached(query_string, params)
+            if self._autocommit:
+                self._connection.commit()
             return self._cursor.rowcount if self._cursor.rowcount else 0
         except (Exception, psycopg2.Error) as error:
-            print(f"Error deleting data: {error}")
+            _log.error("Error deleting data: %s", error)
             self._connection.rollback()
             return 0
 
-    def select_query(self, query_string: str) -> DatabaseResult:
+    def select_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> DatabaseResult:
         """
         Execute SELECT query and retrieve results.
 
         Args:
             query_string: SQL SELECT statement
+            params: Optional values for %s placeholders in query_string
 
         Returns:
-            List of rows as dictionaries (column_name: value).
+            List of rows mapping column_name to value.
         """
         if not self._connection or not self._cursor:
             return []
 
         try:
-            self._cursor.execute(query_string)
+            statement = self._execute_cached(query_string, params)
             rows = self._cursor.fetchall()
+            if not rows:
+                return []
 
-            # Convert RealDictRow to regular dict
-            return [dict(row) for row in rows] if rows else []
+            return self._make_rows(rows, self._result_layout(statement))
         except (Exception, psycopg2.Error) as error:
-            print(f"Error selecting data: {error}")
+            _log.error("Error selecting data: %s", error)
+            self._connection.rollback()
             return []
 
-    def execute_query(self, query_string: str) -> bool:
+    def select_columns(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> DatabaseColumns:
+        """
+        Execute SELECT query and retrieve results column by column.
+
+        Avoids building a dict per row, which is considerably cheaper for
+        large or wide result sets.
+
+        Args:
+            query_string: SQL SELECT statement
+            params: Optional values for %s placeholders in query_string
+
+        Returns:
+            Dict mapping column_name to the list of that column's values.
+        """
+        if not self._connection or not self._cursor:
+            return {}
+
+        try:
+            statement = self._execute_cached(query_string, params)
+            rows = self._cursor.fetchall()
+            columns, _ = self._result_layout(statement)
+            if not rows:
+                return {column: [] for column in columns}
+
+            return dict(zip(columns, map(list, zip(*rows))))
+        except (Exception, psycopg2.Error) as error:
+            _log.error("Error selecting data: %s", error)
+            self._connection.rollback()
+            return {}
+
+    def select_query_iter(
+        self,
+        query_string: str,
+        params: Optional[Sequence[DatabaseValue]] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[DatabaseRow]:
+        """
+        Execute SELECT query and stream results through a server-side cursor.
+
+        Rows are fetched chunk_size at a time, so memory stays bounded
+        regardless of result size and the first rows arrive early.
+
+        Unlike the other query helpers, errors are raised (after rolling
+        back) rather than swallowed: a stream that stopped early would
+        otherwise be indistinguishable from a complete result. Committing
+        on the same connection while iterating invalidates the cursor.
+
+        Args:
+            query_string: SQL SELECT statement
+            params: Optional values for %s placeholders in query_string
+            chunk_size: Number of rows fetched per round trip
+
+        Yields:
+            Rows mapping column_name to value.
+
+        Raises:
+            psycopg2.Error: If the query or a later fetch fails.
+        """
+        if not self._connection:
+            return
+
+        self._cursor_counter += 1
+        cursor = self._connection.cursor(name=f"stream_{self._cursor_counter}")
+        cursor.itersize = chunk_size
+        try:
+            cursor.execute(query_string, params)
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+
+            # Named cursors only expose description after the first fetch
+            layout = _describe(cursor.description)
+            while rows:
+                yield from self._make_rows(rows, layout)
+                rows = cursor.fetchmany(chunk_size)
+        except (Exception, psycopg2.Error) as error:
+            _log.error("Error selecting data: %s", error)
+            self._connection.rollback()
+            raise
+        finally:
+            try:
+                cursor.close()
+            except psycopg2.Error:
+                pass
+
+    def execute_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> bool:
         """
         Execute general SQL query.
 
         Args:
             query_string: SQL statement to execute
+            params: Optional values for %s placeholders in query_string
 
         Returns:
             True if executed successfully.
@@ -180,14 +412,214 @@ class PostgresManager(DatabaseBase):
             return False
 
         try:
-            self._cursor.execute(query_string)
-            self._connection.commit()
+            self._cursor.execute(query_string, params)
+            if self._autocommit:
+                self._connection.commit()
             return True
         except (Exception, psycopg2.Error) as error:
-            print(f"Error executing query: {error}")
+            _log.error("Error executing query: %s", error)
             self._connection.rollback()
             return False
 
+    def compose(self, template: str, *identifiers: str) -> str:
+        """
+        Safely interpolate identifiers (table/column names) into a SQL template.
+
+        Values should still be passed as params; this only quotes names.
+        Requires an open connection. Results are cached per connection, so
+        hot templates are composed once.
+
+        Args:
+            template: SQL text with {} where each identifier goes
+            identifiers: Names to quote, "schema.table" is split on the dot
+
+        Returns:
+            SQL string ready to execute.
+        """
+        key = (template, identifiers)
+        composed = self._compose_cache.get(key)
+        if composed is not None:
+            self._compose_cache.move_to_end(key)
+            return composed
+
+        composed = (
+            sql.SQL(template)
+            .format(*(sql.Identifier(*name.split(".")) for name in identifiers))
+            .as_string(self._connection)
+        )
+        if len(self._compose_cache) >= _COMPOSE_CACHE_SIZE:
+            self._compose_cache.popitem(last=False)
+        self._compose_cache[key] = composed
+        return composed
+
+    def execute_script(self, statements: Sequence[str]) -> bool:
+        """
+        Execute several SQL statements in a single round trip.
+
+        The statements are sent as one multi-statement query, so session setup
+        or catalog bootstrap costs one round trip instead of one per statement.
+        Only the last statement's result is available on the cursor.
+
+        Args:
+            statements: SQL statements to execute, in order
+
+        Returns:
+            True if all statements executed successfully.
+        """
+        if not self._connection or not self._cursor:
+            return False
+
+        try:
+            self._cursor.execute(";\n".join(statements))
+            if self._autocommit:
+                self._connection.commit()
+            return True
+        except (Exception, psycopg2.Error) as error:
+            _log.error("Error executing script: %s", error)
+            self._connection.rollback()
+            return False
+
+    def execute_batch(
+        self,
+        query_string: str,
+        params_seq: Iterable[Sequence[DatabaseValue]],
+        page_size: int = 1000,
+    ) -> int:
+        """
+        Execute a statement once per parameter set in batched round trips.
+
+        Statements are sent page_size at a time and committed once at the end,
+        instead of one round trip and commit per row.
+
+        Args:
+            query_string: SQL statement with %s placeholders
+            params_seq: Sequence of parameter tuples
+            page_size: Number of statements sent per round trip
+
+        Returns:
+            Number of parameter sets executed.
+        """
+        if not self._connection or not self._cursor:
+            return 0
+
+        try:
+            params_list = list(params_seq)
+            psycopg2.extras.execute_batch(
+                self._cursor, query_string, params_list, page_size=page_size
+            )
+            if self._autocommit:
+                self._connection.commit()
+            return len(params_list)
+        except (Exception, psycopg2.Error) as error:
+            _log.error("Error executing batch: %s", error)
+            self._connection.rollback()
+            return 0
+
+    def insert_many(
+        self,
+        query_string: str,
+        params_seq: Iterable[Sequence[DatabaseValue]],
+        page_size: int = 1000,
+    ) -> int:
+        """
+        Execute an INSERT statement for many parameter sets.
+
+        Args:
+            query_string: SQL INSERT statement with %s placeholders
+            params_seq: Sequence of parameter tuples, one per row
+            page_size: Number of statements sent per round trip
+
+        Returns:
+            Number of rows submitted.
+        """
+        return self.execute_batch(query_string, params_seq, page_size)
+
+    def insert_values(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[DatabaseValue]],
+        page_size: int = 1000,
+    ) -> int:
+        """
+        Insert many rows using multi-row VALUES lists.
+
+        Args:
+            table: Target table name (optionally schema-qualified)
+            columns: Column names, in the order of each row's values
+            rows: Sequence of row value tuples
+            page_size: Number of rows per INSERT statement
+
+        Returns:
+            Number of rows submitted.
+        """
+        if not self._connection or not self._cursor:
+            return 0
+
+        try:
+            rows_list = list(rows)
+            query = self.compose(
+                f"INSERT INTO {{}} ({', '.join(['{}'] * len(columns))}) VALUES %s",
+                table,
+                *columns,
+            )
+            psycopg2.extras.execute_values(
+                self._cursor, query, rows_list, page_size=page_size
+            )
+            if self._autocommit:
+                self._connection.commit()
+            return len(rows_list)
+        except (Exception, psycopg2.Error) as error:
+            _log.error("Error inserting data: %s", error)
+            self._connection.rollback()
+            return 0
+
+    def copy_from(
+        self,
+        table: str,
+        rows: Iterable[Sequence[DatabaseValue]],
+        columns: Sequence[str],
+    ) -> int:
+        """
+        Bulk load rows with COPY ... FROM STDIN.
+
+        Much faster than INSERT for large loads: the rows are streamed in
+        COPY text format in a single statement.
+
+        Args:
+            table: Target table name (optionally schema-qualified)
+            rows: Sequence of row value tuples
+            columns: Column names, in the order of each row's values
+
+        Returns:
+            Number of rows copied.
+        """
+        if not self._connection or not self._cursor:
+            return 0
+
+        try:
+            buffer = io.StringIO()
+            count = 0
+            for row in rows:
+                buffer.write("\t".join(map(_copy_text, row)))
+                buffer.write("\n")
+                count += 1
+            buffer.seek(0)
+
+            query = self.compose(
+                f"COPY {{}} ({', '.join(['{}'] * len(columns))}) FROM STDIN",
+                table,
+                *columns,
+            )
+            self._cursor.copy_expert(query, buffer)
+            if self._autocommit:
+                self._connection.commit()
+            return count
+        except (Exception, psycopg2.Error) as error:
+            _log.error("Error copying data: %s", error)
+            self._connection.rollback()
+            return 0
+
     def disconnect(self) -> bool:
         """
         Disconnect from PostgreSQL database.
@@ -202,13 +634,217 @@ class PostgresManager(DatabaseBase):
             if self._connection:
                 self._connection.close()
                 self._connection = None
+            self._stmt_cache.clear()
+            self._stale_statements.clear()
+            self._compose_cache.clear()
             return True
         except (Exception, psycopg2.Error) as error:
-            print(f"Error disconnecting: {error}")
+            _log.error("Error disconnecting: %s", error)
             return False
 
+    def _make_rows(self, rows: List[tuple], layout: _ResultLayout) -> DatabaseResult:
+        """
+        Wrap fetched tuples as result rows.
+
+        Args:
+            rows: Tuples returned by the cursor
+            layout: Column names and index for the result
+
+        Returns:
+            ResultRow views sharing one column index, or dicts if dict_rows is set.
+        """
+        columns, index = layout
+        if self._dict_rows:
+            return [dict(zip(columns, row)) for row in rows]
+
+        return [ResultRow(index, row) for row in rows]
+
+    def _result_layout(self, statement: Optional[_PreparedStatement]) -> _ResultLayout:
+        """
+        Get the layout of the current result, cached per prepared statement.
+
+        A prepared statement's result columns cannot change (PostgreSQL rejects
+        the EXECUTE instead, and the statement is then re-prepared), so its
+        description is introspected only once.
+
+        Args:
+            statement: Cache entry the query ran through, if any
+
+        Returns:
+            Column names and index for the cursor's current result.
+        """
+        cursor = self._cursor
+        assert cursor is not None, "called without an open cursor"
+
+        if statement is None:
+            return _describe(cursor.description)
+        if statement.layout is None:
+            statement.layout = _describe(cursor.description)
+        return statement.layout
+
+    def _execute_cached(
+        self,
+        query_string: str,
+        params: Optional[Sequence[DatabaseValue]],
+        retry: bool = True,
+    ) -> Optional[_PreparedStatement]:
+        """
+        Execute a query, reusing a server-side prepared statement when possible.
+
+        Queries with positional placeholders are prepared once per connection and
+        run with EXECUTE afterwards, so PostgreSQL skips parse/analyze/plan on
+        repeated calls. Anything else, including queries whose params are not
+        plain scalars, multi-statement queries (EXECUTE would only run the
+        first statement) and queries PostgreSQL refuses to prepare, falls
+        through to a plain execute.
+
+        If a cached statement has become invalid, it is dropped from the
+        cache. With autocommit on, the transaction holds nothing but this
+        statement, so it is rolled back and the query re-prepared once.
+
+        Args:
+            query_string: SQL statement
+            params: Values for %s placeholders in query_string
+            retry: Whether an invalidated statement may be retried
+
+        Returns:
+            The statement cache entry used, or None for a plain execute.
+        """
+        cursor, connection = self._cursor, self._connection
+        assert cursor is not None and connection is not None, "called while disconnected"
+
+        if (
+            not params
+            or not self._statement_cache_size
+            or isinstance(params, dict)
+            or "%s" not in query_string
+            or ";" in query_string.rstrip().rstrip(";")
+            or not all(isinstance(value, _PREPARABLE_TYPES) for value in params)
+        ):
+            cursor.execute(query_string, params)
+            return None
+
+        statement = self._stmt_cache.get(query_string)
+        if statement is None:
+            statement = self._prepare_statement(query_string)
+        else:
+            self._stmt_cache.move_to_end(query_string)
+
+        if statement.name is None:
+            cursor.execute(query_string, params)
+            return None
+
+        placeholders = ", ".join(["%s"] * len(params))
+        try:
+            cursor.execute(f"EXECUTE {statement.name} ({placeholders})", params)
+        except (
+            psycopg2.errors.InvalidSqlStatementName,
+            psycopg2.errors.FeatureNotSupported,
+        ) as error:
+            # InvalidSqlStatementName: dropped server-side (e.g. DISCARD ALL).
+            # FeatureNotSupported: "cached plan must not change result type",
+            # the table changed under the statement (e.g. ALTER TABLE under
+            # SELECT *). Either way forget it, so it is prepared again.
+            self._stmt_cache.pop(query_string, None)
+            if isinstance(error, psycopg2.errors.FeatureNotSupported):
+                # Still exists server-side; deallocated once the failed
+                # transaction is rolled back
+                self._stale_statements.append(statement.name)
+            if not retry or not self._autocommit:
+                raise
+            connection.rollback()
+            return self._execute_cached(query_string, params, retry=False)
+        return statement
+
+    def _prepare_statement(self, query_string: str) -> _PreparedStatement:
+        """
+        Issue PREPARE for a query and register it in the statement cache.
+
+        Evicts the least recently used statement with DEALLOCATE when the
+        cache is full. DEALLOCATE and PREPARE run inside savepoints, so a
+        statement already gone server-side, or one that cannot be prepared,
+        leaves the transaction usable; the latter is cached without a name
+        and runs unprepared from then on.
+
+        Args:
+            query_string: SQL statement with %s placeholders
+
+        Returns:
+            Cache entry for the prepared statement.
+        """
+        if len(self._stmt_cache) >= self._statement_cache_size:
+            _, evicted = self._stmt_cache.popitem(last=False)
+            if evicted.name is not None:
+                self._stale_statements.append(evicted.name)
+
+        while self._stale_statements:
+            # Guarded, in case the statement is gone server-side by now
+            stale = self._stale_statements.pop()
+            self._execute_in_savepoint(stale, f"DEALLOCATE {stale}")
+
+        self._stmt_counter += 1
+        name = f"ps_{self._stmt_counter}"
+        # Drop a trailing semicolon so PREPARE wraps exactly one statement
+        body = _to_positional(query_string.rstrip().rstrip(";"))
+        error = self._execute_in_savepoint(name, f"PREPARE {name} AS {body}")
+        if error is None:
+            statement = _PreparedStatement(name)
+        elif isinstance(error, psycopg2.errors.DuplicatePreparedStatement):
+            # The server session already has this name, e.g. another
+            # client's statement behind a transaction-mode pooler. Run
+            # unprepared this time and try a fresh name on the next call.
+            return _PreparedStatement(None)
+        else:
+            _log.debug("Running statement unprepared: %s", error)
+            statement = _PreparedStatement(None)
+
+        self._stmt_cache[query_string] = statement
+        return statement
+
+    def _execute_in_savepoint(self, savepoint: str, statement: str) -> Optional[psycopg2.Error]:
+        """
+        Run a statement inside a savepoint, in one round trip.
+
+        On failure the savepoint is rolled back, so the surrounding
+        transaction stays usable.
+
+        Args:
+            savepoint: Savepoint name
+            statement: SQL statement without parameters
+
+        Returns:
+            The error raised by the statement, or None if it succeeded.
+        """
+        cursor = self._cursor
+        assert cursor is not None, "called without an open cursor"
+
+        try:
+            cursor.execute(
+                f"SAVEPOINT {savepoint}; {statement}; RELEASE SAVEPOINT {savepoint}"
+            )
+        except psycopg2.Error as error:
+            cursor.execute(
+                f"ROLLBACK TO SAVEPOINT {savepoint}; RELEASE SAVEPOINT {savepoint}"
+            )
+            return error
+        return None
+
     # Additional PostgreSQL-specific methods
 
+    def set_autocommit(self, enabled: bool) -> None:
+        """
+        Choose whether query helpers commit after each statement.
+
+        With autocommit disabled, statements accumulate in one transaction
+        until commit_transaction() (or rollback_transaction()) is called, so
+        a loop of inserts costs one COMMIT instead of one per row. A failing
+        statement still rolls back the whole open transaction.
+
+        Args:
+            enabled: True to commit after every helper call (default)
+        """
+        self._autocommit = enabled
+
     def begin_transaction(self) -> bool:
         """Begin a transaction explicitly."""
         if not self._connection:
@@ -217,7 +853,7 @@ class PostgresManager(DatabaseBase):
             # psycopg2 auto-begins transactions, but we can reset isolation level if needed
             return True
         except Exception as error:
-            print(f"Error beginning transaction: {error}")
+            _log.error("Error beginning transaction: %s", error)
             return False
 
     def commit_transaction(self) -> bool:
@@ -228,7 +864,7 @@ class PostgresManager(DatabaseBase):
             self._connection.commit()
             return True
         except Exception as error:
-            print(f"Error committing transaction: {error}")
+            _log.error("Error committing transaction: %s", error)
             return False
 
     def rollback_transaction(self) -> bool:
@@ -239,5 +875,5 @@ class PostgresManager(DatabaseBase):
             self._connection.rollback()
             return True
         except Exception as error:
-            print(f"Error rolling back transaction: {error}")
+            _log.error("Error rolling back transaction: %s", error)
             return False
@@ -1,7 +1,7 @@
 """Core database system components."""
 
 from database_module.core.database_types import DatabaseType
-from database_module.core.database_base import DatabaseBase, DatabaseValue, DatabaseRow, DatabaseResult
+from database_module.core.database_base import DatabaseBase, DatabaseValue, DatabaseRow, DatabaseResult, DatabaseColumns, ResultRow
 from database_module.core.database_manager import DatabaseManager
 
-__all__ = ["DatabaseType", "DatabaseBase", "DatabaseValue", "DatabaseRow", "DatabaseResult", "DatabaseManager"]
+__all__ = ["DatabaseType", "DatabaseBase", "DatabaseValue", "DatabaseRow", "DatabaseResult", "DatabaseColumns", "ResultRow", "DatabaseManager"]
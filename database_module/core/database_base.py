@@ -5,12 +5,54 @@ Equivalent to C++ database/database_base.h
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Union, Optional, Any
+from collections.abc import Mapping as MappingABC
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence, Union, Optional
 
 # Type aliases matching C++ database types
 DatabaseValue = Union[str, int, float, bool, None]
-DatabaseRow = Dict[str, DatabaseValue]
+DatabaseRow = Mapping[str, DatabaseValue]
 DatabaseResult = List[DatabaseRow]
+DatabaseColumns = Dict[str, List[DatabaseValue]]
+
+
+class ResultRow(MappingABC):
+    """
+    Read-only row view over a driver result tuple.
+
+    Rows of one result share a single column-name -> position index, so no
+    dict is built per row. Behaves like a dict for reads (row["name"],
+    row.items(), dict(row)); use as_dict() for a mutable copy.
+    """
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index: Dict[str, int], values: Sequence[DatabaseValue]):
+        """
+        Initialize row view.
+
+        Args:
+            index: Column name to position mapping shared by the result
+            values: Column values in result order
+        """
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, key: str) -> DatabaseValue:
+        return self._values[self._index[key]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return repr(self.as_dict())
+
+    def as_dict(self) -> Dict[str, DatabaseValue]:
+        """Materialize the row as a regular dict."""
+        values = self._values
+        return {name: values[position] for name, position in self._index.items()}
 
 
 class DatabaseBase(ABC):
@@ -21,7 +63,9 @@ class DatabaseBase(ABC):
 
     This class serves as an interface for database operations such as
     connecting, querying, and disconnecting. Derived classes must implement
-    all abstract methods for specific database systems.
+    all abstract methods for specific database systems. The bulk, streaming
+    and column-oriented methods have portable defaults built on the abstract
+    ones; backends override them with faster native implementations.
     """
 
     @abstractmethod
@@ -48,12 +92,15 @@ class DatabaseBase(ABC):
         pass
 
     @abstractmethod
-    def create_query(self, query_string: str) -> bool:
+    def create_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> bool:
         """
         Create/prepare a database query.
 
         Args:
             query_string: SQL query to prepare
+            params: Optional values for %s placeholders in query_string
 
         Returns:
             True if query prepared successfully, False otherwise.
@@ -61,12 +108,15 @@ class DatabaseBase(ABC):
         pass
 
     @abstractmethod
-    def insert_query(self, query_string: str) -> int:
+    def insert_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> int:
         """
         Execute INSERT query.
 
         Args:
             query_string: SQL INSERT statement
+            params: Optional values for %s placeholders in query_string
 
         Returns:
             Number of rows inserted.
@@ -74,12 +124,15 @@ class DatabaseBase(ABC):
         pass
 
     @abstractmethod
-    def update_query(self, query_string: str) -> int:
+    def update_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> int:
         """
         Execute UPDATE query.
 
         Args:
             query_string: SQL UPDATE statement
+            params: Optional values for %s placeholders in query_string
 
         Returns:
             Number of rows updated.
@@ -87,12 +140,15 @@ class DatabaseBase(ABC):
         pass
 
     @abstractmethod
-    def delete_query(self, query_string: str) -> int:
+    def delete_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> int:
         """
         Execute DELETE query.
 
         Args:
             query_string: SQL DELETE statement
+            params: Optional values for %s placeholders in query_string
 
         Returns:
             Number of rows deleted.
@@ -100,31 +156,213 @@ class DatabaseBase(ABC):
         pass
 
     @abstractmethod
-    def select_query(self, query_string: str) -> DatabaseResult:
+    def select_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> DatabaseResult:
         """
         Execute SELECT query and retrieve results.
 
         Args:
             query_string: SQL SELECT statement
+            params: Optional values for %s placeholders in query_string
 
         Returns:
             List of rows as dictionaries. Empty list if query fails.
         """
         pass
 
+    def select_columns(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> DatabaseColumns:
+        """
+        Execute SELECT query and retrieve results column by column.
+
+        Args:
+            query_string: SQL SELECT statement
+            params: Optional values for %s placeholders in query_string
+
+        Returns:
+            Dict mapping column_name to the list of that column's values.
+        """
+        rows = self.select_query(query_string, params)
+        if not rows:
+            return {}
+        return {column: [row[column] for row in rows] for column in rows[0]}
+
+    def select_query_iter(
+        self,
+        query_string: str,
+        params: Optional[Sequence[DatabaseValue]] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[DatabaseRow]:
+        """
+        Execute SELECT query and iterate over the result rows.
+
+        The default fetches the whole result with select_query(); backends
+        with server-side cursors stream it chunk_size rows at a time.
+
+        Args:
+            query_string: SQL SELECT statement
+            params: Optional values for %s placeholders in query_string
+            chunk_size: Number of rows fetched per round trip
+
+        Returns:
+            Iterator over rows mapping column_name to value.
+        """
+        return iter(self.select_query(query_string, params))
+
     @abstractmethod
-    def execute_query(self, query_string: str) -> bool:
+    def execute_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> bool:
         """
         Execute general SQL query (DDL, DML).
 
         Args:
             query_string: SQL query to execute
+            params: Optional values for %s placeholders in query_string
 
         Returns:
             True if executed successfully, False otherwise.
         """
         pass
 
+    def execute_script(self, statements: Sequence[str]) -> bool:
+        """
+        Execute several SQL statements in order.
+
+        Args:
+            statements: SQL statements to execute
+
+        Returns:
+            True if all statements executed successfully.
+        """
+        return all(self.execute_query(statement) for statement in statements)
+
+    def execute_batch(
+        self,
+        query_string: str,
+        params_seq: Iterable[Sequence[DatabaseValue]],
+        page_size: int = 1000,
+    ) -> int:
+        """
+        Execute a statement once per parameter set.
+
+        The default runs one execute_query() per parameter set and stops at
+        the first failure; backends send them in batched round trips.
+
+        Args:
+            query_string: SQL statement with %s placeholders
+            params_seq: Sequence of parameter tuples
+            page_size: Number of statements sent per round trip
+
+        Returns:
+            Number of parameter sets executed.
+        """
+        count = 0
+        for params in params_seq:
+            if not self.execute_query(query_string, params):
+                break
+            count += 1
+        return count
+
+    def insert_many(
+        self,
+        query_string: str,
+        params_seq: Iterable[Sequence[DatabaseValue]],
+        page_size: int = 1000,
+    ) -> int:
+        """
+        Execute an INSERT statement for many parameter sets.
+
+        Args:
+            query_string: SQL INSERT statement with %s placeholders
+            params_seq: Sequence of parameter tuples, one per row
+            page_size: Number of statements sent per round trip
+
+        Returns:
+            Number of rows submitted.
+        """
+        return self.execute_batch(query_string, params_seq, page_size)
+
+    def insert_values(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[DatabaseValue]],
+        page_size: int = 1000,
+    ) -> int:
+        """
+        Insert many rows into a table.
+
+        The default issues one single-row INSERT per row through
+        insert_many(), with table and column names used as given.
+
+        Args:
+            table: Target table name
+            columns: Column names, in the order of each row's values
+            rows: Sequence of row value tuples
+            page_size: Number of rows per round trip
+
+        Returns:
+            Number of rows submitted.
+        """
+        placeholders = ", ".join(["%s"] * len(columns))
+        query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        return self.insert_many(query, rows, page_size)
+
+    def copy_from(
+        self,
+        table: str,
+        rows: Iterable[Sequence[DatabaseValue]],
+        columns: Sequence[str],
+    ) -> int:
+        """
+        Bulk load rows into a table.
+
+        The default falls back to insert_values(); backends with a native
+        bulk load path (e.g. PostgreSQL COPY) use that instead.
+
+        Args:
+            table: Target table name
+            rows: Sequence of row value tuples
+            columns: Column names, in the order of each row's values
+
+        Returns:
+            Number of rows loaded.
+        """
+        return self.insert_values(table, columns, rows)
+
+    @abstractmethod
+    def set_autocommit(self, enabled: bool) -> None:
+        """
+        Choose whether query helpers commit after each statement.
+
+        Args:
+            enabled: True to commit after every helper call
+        """
+        pass
+
+    @abstractmethod
+    def commit_transaction(self) -> bool:
+        """
+        Commit the current transaction.
+
+        Returns:
+            True if committed successfully, False otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def rollback_transaction(self) -> bool:
+        """
+        Roll back the current transaction.
+
+        Returns:
+            True if rolled back successfully, False otherwise.
+        """
+        pass
+
     @abstractmethod
     def disconnect(self) -> bool:
         """
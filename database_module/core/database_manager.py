@@ -5,8 +5,14 @@ Equivalent to C++ database/database_manager.h/cpp
 """
 
 import threading
-from typing import Optional, Dict
-from database_module.core.database_base import DatabaseBase, DatabaseResult
+from typing import Any, Callable, Optional, Dict, Iterable, Iterator, Sequence, Type
+from database_module.core.database_base import (
+    DatabaseBase,
+    DatabaseColumns,
+    DatabaseResult,
+    DatabaseRow,
+    DatabaseValue,
+)
 from database_module.core.database_types import DatabaseType
 from database_module.pool.connection_pool import (
     ConnectionPool,
@@ -14,6 +20,56 @@ from database_module.pool.connection_pool import (
     ConnectionStats,
 )
 
+# Query methods forwarded straight to the active backend once one is set
+_FORWARDED_METHODS = (
+    "create_query",
+    "insert_query",
+    "update_query",
+    "delete_query",
+    "select_query",
+    "select_columns",
+    "select_query_iter",
+    "execute_query",
+    "execute_batch",
+    "insert_many",
+    "insert_values",
+    "copy_from",
+    "set_autocommit",
+    "commit_transaction",
+    "rollback_transaction",
+)
+
+# Backend registry: database type -> backend class, filled on first use
+_BACKENDS: Dict[DatabaseType, Type[DatabaseBase]] = {}
+_backends_loaded = False
+
+
+def _register(db_type: DatabaseType) -> Callable[[Type[DatabaseBase]], Type[DatabaseBase]]:
+    """Class decorator registering a backend class for a database type."""
+
+    def decorator(backend_cls: Type[DatabaseBase]) -> Type[DatabaseBase]:
+        _BACKENDS[db_type] = backend_cls
+        return backend_cls
+
+    return decorator
+
+
+def _get_backend(db_type: DatabaseType) -> Optional[Type[DatabaseBase]]:
+    """
+    Look up the backend class for a database type.
+
+    Built-in backends are imported on the first lookup only, so their
+    drivers stay optional until a backend is actually used.
+    """
+    global _backends_loaded
+    if not _backends_loaded:
+        from database_module.backends.postgres.postgres_manager import PostgresManager
+
+        _register(DatabaseType.POSTGRES)(PostgresManager)
+        # Add other database types here (MySQL, SQLite, etc.)
+        _backends_loaded = True
+    return _BACKENDS.get(db_type)
+
 
 class DatabaseManager:
     """
@@ -24,29 +80,20 @@ class DatabaseManager:
     Manages database connections and operations with singleton pattern.
     """
 
-    _instance: Optional["DatabaseManager"] = None
-    _lock: threading.Lock = threading.Lock()
-
     def __new__(cls):
-        """Singleton implementation using __new__."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
+        """Return the module-level singleton instance."""
+        return _MANAGER
 
     def __init__(self):
-        """Initialize database manager (called once)."""
-        if self._initialized:
-            return
+        """No-op: singleton state is initialized once at module import."""
 
+    def _init_state(self) -> None:
+        """Initialize database manager state (called once at import)."""
         self._database: Optional[DatabaseBase] = None
         self._connected: bool = False
         self._current_type: DatabaseType = DatabaseType.NONE
         self._connection_pools: Dict[DatabaseType, ConnectionPool] = {}
         self._pool_lock = threading.Lock()
-        self._initialized = True
 
     @classmethod
     def handle(cls) -> "DatabaseManager":
@@ -56,26 +103,45 @@ class DatabaseManager:
         Returns:
             DatabaseManager singleton instance.
         """
-        return cls()
+        return _MANAGER
 
-    def set_mode(self, database_type: DatabaseType) -> bool:
+    def set_mode(self, database_type: DatabaseType, **backend_options: Any) -> bool:
         """
         Set database type.
 
         Args:
             database_type: Database type to set
+            backend_options: Keyword arguments for the backend constructor,
+                             e.g. statement_cache_size=0 for PostgreSQL
+                             behind pgbouncer in transaction pooling mode,
+                             or dict_rows=True for mutable dict result rows
 
         Returns:
             True if database type set successfully.
         """
-        from database_module.backends.postgres.postgres_manager import PostgresManager
+        backend = _get_backend(database_type)
+        if backend is None:
+            return False
 
-        if database_type == DatabaseType.POSTGRES:
-            self._database = PostgresManager()
-            self._current_type = database_type
-            return True
-        # Add other database types here (MySQL, SQLite, etc.)
-        return False
+        self._database = backend(**backend_options)
+        self._current_type = database_type
+        self._bind_backend()
+        return True
+
+    def _bind_backend(self) -> None:
+        """
+        Bind the forwarding query methods directly to the active backend.
+
+        The instance attributes shadow the class wrappers, skipping their
+        "no backend" check on every call. Without a backend the class
+        wrappers are restored.
+        """
+        for name in _FORWARDED_METHODS:
+            method = getattr(self._database, name, None)
+            if method is not None:
+                setattr(self, name, method)
+            else:
+                self.__dict__.pop(name, None)
 
     def database_type(self) -> DatabaseType:
         """Get current database type."""
@@ -97,29 +163,108 @@ class DatabaseManager:
         self._connected = self._database.connect(connect_string)
         return self._connected
 
-    def create_query(self, query_string: str) -> bool:
+    def create_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> bool:
         """Execute DDL query."""
-        return self._database.create_query(query_string) if self._database else False
+        return self._database.create_query(query_string, params) if self._database else False
 
-    def insert_query(self, query_string: str) -> int:
+    def insert_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> int:
         """Execute INSERT query."""
-        return self._database.insert_query(query_string) if self._database else 0
+        return self._database.insert_query(query_string, params) if self._database else 0
 
-    def update_query(self, query_string: str) -> int:
+    def update_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> int:
         """Execute UPDATE query."""
-        return self._database.update_query(query_string) if self._database else 0
+        return self._database.update_query(query_string, params) if self._database else 0
 
-    def delete_query(self, query_string: str) -> int:
+    def delete_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> int:
         """Execute DELETE query."""
-        return self._database.delete_query(query_string) if self._database else 0
+        return self._database.delete_query(query_string, params) if self._database else 0
 
-    def select_query(self, query_string: str) -> DatabaseResult:
+    def select_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> DatabaseResult:
         """Execute SELECT query."""
-        return self._database.select_query(query_string) if self._database else []
+        return self._database.select_query(query_string, params) if self._database else []
+
+    def select_columns(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> DatabaseColumns:
+        """Execute SELECT query and return results column by column."""
+        return self._database.select_columns(query_string, params) if self._database else {}
+
+    def select_query_iter(
+        self,
+        query_string: str,
+        params: Optional[Sequence[DatabaseValue]] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[DatabaseRow]:
+        """Execute SELECT query and stream result rows."""
+        if not self._database:
+            return iter(())
+        return self._database.select_query_iter(query_string, params, chunk_size)
 
-    def execute_query(self, query_string: str) -> bool:
+    def execute_query(
+        self, query_string: str, params: Optional[Sequence[DatabaseValue]] = None
+    ) -> bool:
         """Execute general SQL query."""
-        return self._database.execute_query(query_string) if self._database else False
+        return self._database.execute_query(query_string, params) if self._database else False
+
+    def execute_batch(
+        self,
+        query_string: str,
+        params_seq: Iterable[Sequence[DatabaseValue]],
+        page_size: int = 1000,
+    ) -> int:
+        """Execute a statement once per parameter set in batched round trips."""
+        return self._database.execute_batch(query_string, params_seq, page_size) if self._database else 0
+
+    def insert_many(
+        self,
+        query_string: str,
+        params_seq: Iterable[Sequence[DatabaseValue]],
+        page_size: int = 1000,
+    ) -> int:
+        """Execute an INSERT statement for many parameter sets."""
+        return self._database.insert_many(query_string, params_seq, page_size) if self._database else 0
+
+    def insert_values(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[DatabaseValue]],
+        page_size: int = 1000,
+    ) -> int:
+        """Insert many rows using multi-row VALUES lists."""
+        return self._database.insert_values(table, columns, rows, page_size) if self._database else 0
+
+    def copy_from(
+        self,
+        table: str,
+        rows: Iterable[Sequence[DatabaseValue]],
+        columns: Sequence[str],
+    ) -> int:
+        """Bulk load rows with COPY."""
+        return self._database.copy_from(table, rows, columns) if self._database else 0
+
+    def set_autocommit(self, enabled: bool) -> None:
+        """Choose whether query helpers commit after each statement."""
+        if self._database:
+            self._database.set_autocommit(enabled)
+
+    def commit_transaction(self) -> bool:
+        """Commit the current transaction."""
+        return self._database.commit_transaction() if self._database else False
+
+    def rollback_transaction(self) -> bool:
+        """Roll back the current transaction."""
+        return self._database.rollback_transaction() if self._database else False
 
     def disconnect(self) -> bool:
         """
@@ -155,20 +300,34 @@ class DatabaseManager:
                 # Pool already exists
                 return False
 
-            # Create connection factory function based on database type
+            backend = _get_backend(db_type)
+            if backend is None:
+                return False
+
+            # Create connection factory function for the backend
             def create_connection():
-                from database_module.backends.postgres.postgres_manager import (
-                    PostgresManager,
-                )
-
-                if db_type == DatabaseType.POSTGRES:
-                    manager = PostgresManager()
-                    if manager.connect(config.connection_string):
-                        return manager
-                # Add other database types here
-                return None
-
-            pool = ConnectionPool(config, create_connection)
+                manager = backend(**config.backend_options)
+                if not manager.connect(config.connection_string):
+                    return None
+                if config.init_statements and not manager.execute_script(
+                    config.init_statements
+                ):
+                    manager.disconnect()
+                    return None
+                return manager
+
+            def validate_connection(manager) -> bool:
+                return manager.execute_query(config.validation_query)
+
+            def reset_connection(manager) -> bool:
+                # Don't hand the next borrower an open transaction or a
+                # manual-commit mode left behind by the previous one
+                manager.set_autocommit(True)
+                return manager.rollback_transaction()
+
+            pool = ConnectionPool(
+                config, create_connection, validate_connection, reset_connection
+            )
             self._connection_pools[db_type] = pool
             return True
 
@@ -182,8 +341,8 @@ class DatabaseManager:
         Returns:
             ConnectionPool if found, None otherwise
         """
-        with self._pool_lock:
-            return self._connection_pools.get(db_type)
+        # Pools are only added under _pool_lock; a single dict read is atomic
+        return self._connection_pools.get(db_type)
 
     def get_pool_stats(self) -> Dict[DatabaseType, ConnectionStats]:
         """
@@ -204,11 +363,16 @@ class DatabaseManager:
 
         Args:
             db_type: Optional database type. If None, uses current database type.
+                     QueryBuilder output is currently the same for every type.
 
         Returns:
             QueryBuilder configured for the specified database
         """
         from database_module.query.query_builder import QueryBuilder
 
-        target_type = db_type if db_type is not None else self._current_type
         return QueryBuilder()
+
+
+# Module import is thread-safe, so the singleton needs no lock
+_MANAGER = object.__new__(DatabaseManager)
+_MANAGER._init_state()
@@ -4,14 +4,23 @@ Connection pool implementation.
 Equivalent to C++ database/connection_pool.h/cpp
 """
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional, List
-from queue import Queue, Empty
+from typing import Any, Callable, Deque, Dict, Optional, List, Tuple
+import logging
+import sys
 import threading
 import time
+import weakref
 
+_log = logging.getLogger(__name__)
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older versions keep a __dict__
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ConnectionPoolConfig:
     """
     Connection pool configuration.
@@ -25,9 +34,21 @@ class ConnectionPoolConfig:
     health_check_interval_seconds: float = 60.0
     enable_health_checks: bool = True
     connection_string: str = ""
-
-
-@dataclass
+    # Run on connections idle longer than idle_timeout_seconds before reuse
+    validation_query: str = "SELECT 1"
+    # Statements run on every new connection, sent together in one round trip
+    init_statements: List[str] = field(default_factory=list)
+    # Keyword arguments for the backend constructor of DatabaseManager pools,
+    # e.g. {"statement_cache_size": 0} for PostgreSQL behind pgbouncer or
+    # {"dict_rows": True} for mutable dict result rows
+    backend_options: Dict[str, Any] = field(default_factory=dict)
+    # Keep each thread's last released connection for its next acquire.
+    # Parked connections are reserved for that thread (reported as in use),
+    # so only enable when worker threads <= max_connections.
+    thread_local_cache: bool = False
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ConnectionStats:
     """
     Connection pool statistics.
@@ -42,6 +63,59 @@ class ConnectionStats:
     last_health_check: float = field(default_factory=time.time)
 
 
+def _close_connection(conn: object) -> None:
+    """Close a pooled connection (database managers or raw DB-API connections)."""
+    close = getattr(conn, "disconnect", None) or getattr(conn, "close", None)
+    if close is None:
+        return
+    try:
+        close()
+    except Exception as e:
+        _log.error("Failed to close connection: %s", e)
+
+
+def _health_check_loop(
+    pool_ref: "weakref.ref[ConnectionPool]", stop: threading.Event, interval: float
+) -> None:
+    """Periodically prune idle connections until stopped or the pool is gone."""
+    while not stop.wait(interval):
+        pool = pool_ref()
+        if pool is None:
+            return
+        pool._prune_idle()
+        del pool
+
+
+class _ThreadSlot:
+    """Per-thread parking slot for one released connection."""
+
+    __slots__ = ("conn", "parked_since", "pool_ref", "hits", "__weakref__")
+
+    def __init__(self, pool: "ConnectionPool"):
+        self.conn: Optional[object] = None
+        # When conn was parked, so a long-parked connection is validated
+        self.parked_since = 0.0
+        self.pool_ref = weakref.ref(pool)
+        # Acquisitions served from this slot; written by its thread only
+        self.hits = 0
+
+    def __del__(self):
+        """Hand the parked connection and counters back to the pool on thread exit."""
+        pool = self.pool_ref()
+        if pool is not None:
+            pool._retire_slot(self)
+
+
+class _Waiter:
+    """A thread blocked in acquire(), queued for a direct connection handoff."""
+
+    __slots__ = ("event", "conn")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.conn: Optional[object] = None
+
+
 class ConnectionPool:
     """
     Database connection pool.
@@ -51,88 +125,307 @@ class ConnectionPool:
     Manages a pool of database connections for reuse.
     """
 
-    def __init__(self, config: ConnectionPoolConfig, create_connection_func):
+    def __init__(
+        self,
+        config: ConnectionPoolConfig,
+        create_connection_func,
+        validate_connection_func: Optional[Callable[[object], bool]] = None,
+        reset_connection_func: Optional[Callable[[object], bool]] = None,
+    ):
         """
         Initialize connection pool.
 
         Args:
             config: Pool configuration
             create_connection_func: Function to create new connection
+            validate_connection_func: Optional function returning True if a
+                                      connection that sat idle past
+                                      idle_timeout_seconds is still usable
+            reset_connection_func: Optional function run on every release to
+                                   clear session state (e.g. roll back an
+                                   open transaction); returning False or
+                                   raising drops the connection instead
         """
         self._config = config
         self._create_connection = create_connection_func
-        self._available: Queue = Queue(maxsize=config.max_connections)
-        self._in_use: List = []
-        self._lock = threading.Lock()
+        self._validate_connection = validate_connection_func
+        self._reset_connection = reset_connection_func
         self._total_connections = 0
 
-        # Statistics tracking
+        # Idle connections with the time they were released, used as a stack:
+        # the most recently used (warmest) connection is handed out first and
+        # the oldest ones sink to the left end, where pruning finds them.
+        self._idle: Deque[Tuple[object, float]] = deque()
+        # Borrowed (or thread-parked) connections keyed by id(), so connection
+        # objects need not be hashable
+        self._in_use: Dict[int, object] = {}
+        # Guards _idle, _waiters, _in_use, _total_connections and _stats
+        self._lock = threading.Lock()
+        # Threads waiting for a connection, oldest first
+        self._waiters: Deque[_Waiter] = deque()
+
+        # Settings read on every acquire/release, copied out of the config
+        # once instead of through an attribute chain on each call
+        self._thread_local_cache = config.thread_local_cache
+        self._acquire_timeout = config.acquire_timeout_seconds
+        self._tls = threading.local()
+        # Live thread slots: id(slot) -> weakref, dropped when the slot dies
+        self._thread_slots: Dict[int, "weakref.ref[_ThreadSlot]"] = {}
+
+        # Statistics tracking; counters are bumped inside critical sections
+        # acquire() already holds, so they cost no extra lock round
         self._stats = ConnectionStats()
-        self._stats_lock = threading.Lock()
 
-        # Pre-create minimum connections
-        for _ in range(config.min_connections):
-            conn = self._create_new_connection()
-            if conn:
-                self._available.put(conn)
+        # Pre-create minimum connections concurrently, so startup costs one
+        # connection handshake instead of min_connections of them
+        if config.min_connections > 1:
+            with ThreadPoolExecutor(max_workers=config.min_connections) as executor:
+                conns = list(
+                    executor.map(
+                        lambda _: self._create_new_connection(),
+                        range(config.min_connections),
+                    )
+                )
+        else:
+            # Nothing to overlap; skip the worker thread
+            conns = [self._create_new_connection() for _ in range(config.min_connections)]
+        with self._lock:
+            for conn in conns:
+                if conn:
+                    self._store_idle(conn)
+
+        # Background pruning of connections idle past idle_timeout_seconds
+        self._health_check_stop = threading.Event()
+        if config.enable_health_checks and config.health_check_interval_seconds > 0:
+            threading.Thread(
+                target=_health_check_loop,
+                args=(
+                    weakref.ref(self),
+                    self._health_check_stop,
+                    config.health_check_interval_seconds,
+                ),
+                name="ConnectionPool-health-check",
+                daemon=True,
+            ).start()
 
     def _create_new_connection(self):
-        """Create a new database connection."""
+        """
+        Create a new database connection if the pool is below max_connections.
+
+        The slot is reserved under the lock, but the (slow) connection attempt
+        itself runs outside of it.
+        """
+        with self._lock:
+            if not self._reserve_slot():
+                return None
+        return self._connect_reserved()
+
+    def _reserve_slot(self) -> bool:
+        """Reserve room for one new connection if below max_connections (caller holds _lock)."""
+        if self._total_connections >= self._config.max_connections:
+            return False
+        self._total_connections += 1
+        return True
+
+    def _connect_reserved(self):
+        """
+        Create a connection for a slot reserved with _reserve_slot().
+
+        On failure the slot is given back and the oldest waiter is woken to
+        use it, so the capacity is not lost until a release.
+        """
         try:
             conn = self._create_connection()
-            with self._lock:
-                self._total_connections += 1
-            return conn
         except Exception as e:
-            print(f"Failed to create connection: {e}")
-            return None
+            _log.error("Failed to create connection: %s", e)
+            conn = None
 
-    def acquire(self, timeout: Optional[float] = None) -> Optional[object]:
-        """
-        Acquire a connection from the pool.
+        if conn is None:
+            with self._lock:
+                self._total_connections -= 1
+                if self._waiters:
+                    self._waiters.popleft().event.set()
+        return conn
 
-        Args:
-            timeout: Maximum time to wait for connection (seconds)
+    def _take_idle(self) -> Tuple[Optional[object], float]:
+        """
+        Pop the most recently released idle connection (caller holds _lock).
 
         Returns:
-            Database connection object, or None if timeout.
+            Tuple of (connection or None, time it became idle).
+        """
+        if not self._idle:
+            return None, 0.0
+        conn, idle_since = self._idle.pop()
+        self._in_use[id(conn)] = conn
+        return conn, idle_since
+
+    def _store_idle(self, conn: object) -> None:
+        """
+        Hand a connection to the oldest waiter, or push it onto the idle stack
+        if nobody is waiting (caller holds _lock).
+
+        The direct handoff means a thread calling acquire() at the right
+        moment can never overtake threads that are already waiting.
         """
-        timeout = timeout or self._config.acquire_timeout_seconds
+        if self._waiters:
+            waiter = self._waiters.popleft()
+            waiter.conn = conn
+            self._in_use[id(conn)] = conn
+            self._stats.successful_acquisitions += 1
+            waiter.event.set()
+        else:
+            self._idle.append((conn, time.monotonic()))
+
+    def _is_usable(self, conn: object, idle_since: float) -> bool:
+        """
+        Check a connection taken from the idle stack before handing it out.
 
+        Only connections idle longer than idle_timeout_seconds are validated,
+        so recently used connections cost no extra round trip.
+        """
+        if self._validate_connection is None:
+            return True
+        if time.monotonic() - idle_since <= self._config.idle_timeout_seconds:
+            return True
         try:
-            # Try to get from available pool
-            conn = self._available.get(timeout=timeout)
-            with self._lock:
-                self._in_use.append(conn)
+            return bool(self._validate_connection(conn))
+        except Exception:
+            return False
 
-            # Update statistics
-            with self._stats_lock:
-                self._stats.successful_acquisitions += 1
-                self._stats.active_connections = len(self._in_use)
-                self._stats.available_connections = self._available.qsize()
+    def _discard(self, conn: object, counted: bool = True) -> None:
+        """
+        Remove a borrowed connection that must not be reused and close it.
 
-            return conn
-        except Empty:
-            # Pool exhausted, try to create new if under max
-            with self._lock:
-                if self._total_connections < self._config.max_connections:
-                    conn = self._create_new_connection()
-                    if conn:
-                        self._in_use.append(conn)
+        Args:
+            conn: Connection to drop
+            counted: Whether acquire() has just counted it as a successful
+                     acquisition that is now undone (parked and released
+                     connections are not)
+        """
+        with self._lock:
+            self._in_use.pop(id(conn), None)
+            self._total_connections -= 1
+            if counted:
+                # acquire() counted it when taking it from the idle stack
+                self._stats.successful_acquisitions -= 1
+            if self._waiters:
+                # Capacity freed up: let the oldest waiter create a connection
+                self._waiters.popleft().event.set()
+        _close_connection(conn)
+
+    def _prune_idle(self) -> None:
+        """Close idle connections past idle_timeout_seconds, keeping min_connections."""
+        expired = []
+        cutoff = time.monotonic() - self._config.idle_timeout_seconds
+        with self._lock:
+            # The left end holds the connections idle the longest
+            while (
+                self._idle
+                and self._total_connections > self._config.min_connections
+                and self._idle[0][1] < cutoff
+            ):
+                conn, _ = self._idle.popleft()
+                self._total_connections -= 1
+                expired.append(conn)
+            self._stats.last_health_check = time.time()
+
+        for conn in expired:
+            _close_connection(conn)
+
+    def _retire_slot(self, slot: _ThreadSlot) -> None:
+        """Fold a dying thread slot's counters into the stats and return its connection."""
+        # Zero the slot first: a concurrent get_stats() may briefly undercount,
+        # but never counts these hits twice
+        hits, slot.hits = slot.hits, 0
+        with self._lock:
+            self._stats.successful_acquisitions += hits
+        if slot.conn is not None:
+            self._put_idle(slot.conn)
 
-                        # Update statistics
-                        with self._stats_lock:
-                            self._stats.successful_acquisitions += 1
-                            self._stats.active_connections = len(self._in_use)
-                            self._stats.available_connections = self._available.qsize()
+    def _put_idle(self, conn: object) -> None:
+        """Return a borrowed connection to the idle stack."""
+        with self._lock:
+            if self._in_use.pop(id(conn), None) is None:
+                # Not borrowed from this pool, or already released
+                return
+            self._store_idle(conn)
 
-                        return conn
+    def acquire(self, timeout: Optional[float] = None) -> Optional[object]:
+        """
+        Acquire a connection from the pool.
 
-            # Failed to acquire
-            with self._stats_lock:
-                self._stats.failed_acquisitions += 1
+        Args:
+            timeout: Maximum time to wait for connection (seconds)
 
-            return None
+        Returns:
+            Database connection object, or None if timeout.
+        """
+        timeout = timeout or self._acquire_timeout
+
+        if self._thread_local_cache:
+            slot = getattr(self._tls, "slot", None)
+            if slot is not None and slot.conn is not None:
+                # Thread-local fast path: no shared pool traffic, no lock
+                conn, slot.conn = slot.conn, None
+                if self._is_usable(conn, slot.parked_since):
+                    slot.hits += 1
+                    return conn
+                # Parked past idle_timeout_seconds and stale: drop it
+                self._discard(conn, counted=False)
+
+        deadline = time.monotonic() + timeout
+        while True:
+            reserved = False
+            waiter = None
+            with self._lock:
+                # Fast path: take an idle connection, else make room for a
+                # new one, else queue up for a released one
+                conn, idle_since = self._take_idle()
+                if conn is not None:
+                    self._stats.successful_acquisitions += 1
+                elif self._reserve_slot():
+                    reserved = True
+                else:
+                    waiter = _Waiter()
+                    self._waiters.append(waiter)
+
+            if reserved:
+                conn = self._connect_reserved()
+                with self._lock:
+                    if conn is None:
+                        # Factory failed and the slot went to the oldest
+                        # waiter; fail fast rather than queue behind it
+                        self._stats.failed_acquisitions += 1
+                        return None
+                    self._in_use[id(conn)] = conn
+                    self._stats.successful_acquisitions += 1
+                return conn
+
+            if waiter is not None:
+                # Released connections are handed to waiters in FIFO order
+                waiter.event.wait(deadline - time.monotonic())
+                with self._lock:
+                    conn = waiter.conn
+                    if conn is None:
+                        try:
+                            self._waiters.remove(waiter)
+                        except ValueError:
+                            pass  # already woken because capacity freed up
+                        if time.monotonic() >= deadline:
+                            # Failed to acquire
+                            self._stats.failed_acquisitions += 1
+                            return None
+                if conn is None:
+                    # Woken because a slot freed up: try to create a connection
+                    continue
+                # Handed over straight from a release, so no validation needed
+                return conn
+
+            if self._is_usable(conn, idle_since):
+                return conn
+            # Stale connection: drop it and try again
+            self._discard(conn)
 
     def release(self, conn: object) -> None:
         """
@@ -141,10 +434,57 @@ class ConnectionPool:
         Args:
             conn: Connection to release
         """
+        if self._reset_connection is not None and id(conn) in self._in_use:
+            try:
+                reusable = bool(self._reset_connection(conn))
+            except Exception as e:
+                _log.error("Failed to reset connection: %s", e)
+                reusable = False
+            if not reusable:
+                self._discard(conn, counted=False)
+                return
+
+        if self._thread_local_cache:
+            slot = getattr(self._tls, "slot", None)
+            if slot is None:
+                slot = self._tls.slot = _ThreadSlot(self)
+                slots, key = self._thread_slots, id(slot)
+
+                def forget(_: "weakref.ref[_ThreadSlot]") -> None:
+                    slots.pop(key, None)
+
+                slots[key] = weakref.ref(slot, forget)
+            if slot.conn is conn:
+                # Already parked: a repeated release is a no-op
+                return
+            # Park only borrowed connections, and only when nobody is waiting,
+            # so parked connections cannot starve other threads
+            if slot.conn is None and not self._waiters and id(conn) in self._in_use:
+                slot.conn = conn
+                slot.parked_since = time.monotonic()
+                return
+
+        self._put_idle(conn)
+
+    def flush_thread_cache(self) -> None:
+        """Return the calling thread's parked connection to the shared pool."""
+        slot = getattr(self._tls, "slot", None)
+        if slot is not None and slot.conn is not None:
+            conn, slot.conn = slot.conn, None
+            self._put_idle(conn)
+
+    def close(self) -> None:
+        """Stop health checks and close all idle connections."""
+        self._health_check_stop.set()
         with self._lock:
-            if conn in self._in_use:
-                self._in_use.remove(conn)
-                self._available.put(conn)
+            idle = []
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._total_connections -= 1
+                idle.append(conn)
+
+        for conn in idle:
+            _close_connection(conn)
 
     def size(self) -> int:
         """Get total number of connections in pool."""
@@ -152,30 +492,34 @@ class ConnectionPool:
 
     def available_count(self) -> int:
         """Get number of available connections."""
-        return self._available.qsize()
+        return len(self._idle)
 
     def in_use_count(self) -> int:
         """Get number of connections in use."""
-        with self._lock:
-            return len(self._in_use)
+        return len(self._in_use)
 
     def get_stats(self) -> ConnectionStats:
         """
         Get connection pool statistics.
 
+        Statistics are read without taking the pool lock, so under concurrent
+        use the fields are individually current but not a single snapshot.
+
         Returns:
             ConnectionStats object with current pool statistics.
         """
-        with self._stats_lock:
-            # Update current state
-            self._stats.total_connections = self._total_connections
-            self._stats.active_connections = len(self._in_use)
-            self._stats.available_connections = self._available.qsize()
-            return ConnectionStats(
-                total_connections=self._stats.total_connections,
-                active_connections=self._stats.active_connections,
-                available_connections=self._stats.available_connections,
-                failed_acquisitions=self._stats.failed_acquisitions,
-                successful_acquisitions=self._stats.successful_acquisitions,
-                last_health_check=self._stats.last_health_check,
-            )
+        # Current state is derived from the live counters; list() copies the
+        # slot registry atomically, so it can be walked while threads register
+        thread_hits = 0
+        for ref in list(self._thread_slots.values()):
+            slot = ref()
+            if slot is not None:
+                thread_hits += slot.hits
+        return ConnectionStats(
+            total_connections=self._total_connections,
+            active_connections=len(self._in_use),
+            available_connections=len(self._idle),
+            failed_acquisitions=self._stats.failed_acquisitions,
+            successful_acquisitions=self._stats.successful_acquisitions + thread_hits,
+            last_health_check=self._stats.last_health_check,
+        )
@@ -4,9 +4,48 @@ SQL query builder implementation.
 Equivalent to C++ database/query_builder.h/cpp
 """
 
+import sys
 from enum import IntEnum
-from typing import List, Dict, Optional, Union, Any
-from database_module.core.database_base import DatabaseValue
+from typing import Any, Callable, List, Dict, Optional, Tuple, Union, cast
+
+# SQL keywords indexed by JoinType / SortOrder value
+_JOIN_SQL = ("INNER JOIN", "LEFT JOIN", "RIGHT JOIN", "FULL OUTER JOIN", "CROSS JOIN")
+_SORT_SQL = ("ASC", "DESC")
+
+# Pre-formatted clause pieces, interned once. Only these fixed keywords are
+# interned: caller strings (tables, conditions, sort columns) may be dynamic,
+# and interned strings are immortal on CPython 3.12+.
+_JOIN_PREFIX = tuple(sys.intern(keyword + " ") for keyword in _JOIN_SQL)
+_SORT_SUFFIX = tuple(sys.intern(" " + keyword) for keyword in _SORT_SQL)
+
+# Values the builder accepts. Wider than DatabaseValue: callers also pass
+# tuples for IN, dates and other driver-adaptable types, and a mypyc build
+# would reject anything outside a declared union at runtime.
+_Value = Any
+
+# Value types whose str() is already a valid SQL literal
+_NUMERIC_TYPES = frozenset((int, float))
+
+
+def _quote_literal(value: str) -> str:
+    """Quote a string as a SQL literal, doubling embedded single quotes."""
+    # Most values have no quotes; skip the replace then
+    return "'" + (value.replace("'", "''") if "'" in value else value) + "'"
+
+
+def _format_value(value: _Value) -> str:
+    """Format a value as an inline SQL literal."""
+    if value is None:
+        return "NULL"
+    elif isinstance(value, str):
+        return _quote_literal(value)
+    elif value is True:
+        # bool cannot be subclassed, so identity checks are exact
+        return "TRUE"
+    elif value is False:
+        return "FALSE"
+    else:
+        return str(value)
 
 
 class JoinType(IntEnum):
@@ -23,14 +62,7 @@ class JoinType(IntEnum):
 
     def to_sql(self) -> str:
         """Convert to SQL string."""
-        mapping = {
-            JoinType.INNER: "INNER JOIN",
-            JoinType.LEFT: "LEFT JOIN",
-            JoinType.RIGHT: "RIGHT JOIN",
-            JoinType.FULL_OUTER: "FULL OUTER JOIN",
-            JoinType.CROSS: "CROSS JOIN",
-        }
-        return mapping[self]
+        return _JOIN_SQL[self]
 
 
 class SortOrder(IntEnum):
@@ -44,7 +76,7 @@ class SortOrder(IntEnum):
 
     def to_sql(self) -> str:
         """Convert to SQL string."""
-        return "ASC" if self == SortOrder.ASC else "DESC"
+        return _SORT_SQL[self]
 
 
 class QueryCondition:
@@ -54,13 +86,22 @@ class QueryCondition:
     Equivalent to C++ query_condition class.
     """
 
+    __slots__ = (
+        "field",
+        "operator",
+        "value",
+        "raw_condition",
+        "sub_conditions",
+        "logical_operator",
+    )
+
     def __init__(
         self,
         field: Optional[str] = None,
         operator: Optional[str] = None,
-        value: Optional[DatabaseValue] = None,
+        value: Optional[_Value] = None,
         raw_condition: Optional[str] = None,
-    ):
+    ) -> None:
         """
         Initialize query condition.
 
@@ -74,30 +115,35 @@ class QueryCondition:
         self.operator = operator
         self.value = value
         self.raw_condition = raw_condition
-        self.sub_conditions: List[QueryCondition] = []
+        # Only combined (AND/OR) conditions have sub-conditions
+        self.sub_conditions: Optional[List[QueryCondition]] = None
         self.logical_operator: Optional[str] = None
 
-    def to_sql(self) -> str:
-        """Convert condition to SQL string."""
+    def to_sql(self, params: Optional[List[_Value]] = None) -> str:
+        """
+        Convert condition to SQL string.
+
+        Args:
+            params: If given, values are appended here and rendered as %s
+                    placeholders instead of inline literals
+
+        Returns:
+            SQL condition string.
+        """
         if self.raw_condition:
             return self.raw_condition
 
         if self.sub_conditions:
-            conditions = [cond.to_sql() for cond in self.sub_conditions]
+            conditions = [cond.to_sql(params) for cond in self.sub_conditions]
             joined = f" {self.logical_operator} ".join(conditions)
             return f"({joined})"
 
         # Format value
-        if self.value is None:
-            formatted_value = "NULL"
-        elif isinstance(self.value, str):
-            # Escape single quotes
-            escaped = self.value.replace("'", "''")
-            formatted_value = f"'{escaped}'"
-        elif isinstance(self.value, bool):
-            formatted_value = "TRUE" if self.value else "FALSE"
+        if params is not None:
+            params.append(self.value)
+            formatted_value = "%s"
         else:
-            formatted_value = str(self.value)
+            formatted_value = _format_value(self.value)
 
         return f"{self.field} {self.operator} {formatted_value}"
 
@@ -129,7 +175,23 @@ class QueryBuilder:
         Use parameterized methods instead.
     """
 
-    def __init__(self):
+    __slots__ = (
+        "_query_type",
+        "_select_columns",
+        "_from_table",
+        "_where_conditions",
+        "_joins",
+        "_group_by_columns",
+        "_having_clause",
+        "_order_by_clauses",
+        "_limit_count",
+        "_offset_count",
+        "_target_table",
+        "_set_data",
+        "_insert_rows",
+    )
+
+    def __init__(self) -> None:
         """Initialize query builder."""
         self._query_type: Optional[str] = None
         self._select_columns: List[str] = []
@@ -142,10 +204,10 @@ class QueryBuilder:
         self._limit_count: Optional[int] = None
         self._offset_count: Optional[int] = None
 
-        # For INSERT/UPDATE
+        # For INSERT/UPDATE; always set together with _query_type
         self._target_table: Optional[str] = None
-        self._set_data: Dict[str, DatabaseValue] = {}
-        self._insert_rows: List[Dict[str, DatabaseValue]] = []
+        self._set_data: Dict[str, _Value] = {}
+        self._insert_rows: List[Dict[str, _Value]] = []
 
     # SELECT operations
 
@@ -186,7 +248,7 @@ class QueryBuilder:
         self,
         field: str,
         operator: str,
-        value: DatabaseValue,
+        value: _Value,
     ) -> "QueryBuilder":
         """
         Add WHERE condition.
@@ -249,7 +311,7 @@ class QueryBuilder:
         Returns:
             Self for chaining.
         """
-        join_str = f"{join_type.to_sql()} {table} ON {condition}"
+        join_str = _JOIN_PREFIX[join_type] + table + " ON " + condition
         self._joins.append(join_str)
         return self
 
@@ -307,8 +369,7 @@ class QueryBuilder:
         Returns:
             Self for chaining.
         """
-        order_str = f"{column} {order.to_sql()}"
-        self._order_by_clauses.append(order_str)
+        self._order_by_clauses.append(column + _SORT_SUFFIX[order])
         return self
 
     # LIMIT and OFFSET
@@ -356,7 +417,7 @@ class QueryBuilder:
         return self
 
     def values(
-        self, data: Union[Dict[str, DatabaseValue], List[Dict[str, DatabaseValue]]]
+        self, data: Union[Dict[str, _Value], List[Dict[str, _Value]]]
     ) -> "QueryBuilder":
         """
         Set values for INSERT.
@@ -390,7 +451,7 @@ class QueryBuilder:
         return self
 
     def set(
-        self, field_or_data: Union[str, Dict[str, DatabaseValue]], value: Optional[DatabaseValue] = None
+        self, field_or_data: Union[str, Dict[str, _Value]], value: Optional[_Value] = None
     ) -> "QueryBuilder":
         """
         Set field values for UPDATE.
@@ -433,138 +494,164 @@ class QueryBuilder:
         Returns:
             SQL query string.
         """
-        if self._query_type == "SELECT":
-            return self._build_select()
-        elif self._query_type == "INSERT":
-            return self._build_insert()
-        elif self._query_type == "UPDATE":
-            return self._build_update()
-        elif self._query_type == "DELETE":
-            return self._build_delete()
-        else:
+        return self._build(None)
+
+    def build_parameterized(self) -> Tuple[str, List[_Value]]:
+        """
+        Build final SQL query with values bound as %s placeholders.
+
+        The result can be passed straight to the query methods, e.g.
+        ``db.select_query(*builder.build_parameterized())``. The driver then
+        binds the values, and repeated queries share one prepared statement.
+        Literal % signs in raw fragments (where_raw, having, joins) must be
+        written as %%.
+
+        Returns:
+            Tuple of (SQL query string, parameter values in placeholder order).
+        """
+        params: List[_Value] = []
+        return self._build(params), params
+
+    def _build(self, params: Optional[List[_Value]]) -> str:
+        """Build the query, collecting values into params if given."""
+        build_method = _BUILDERS.get(self._query_type)
+        if build_method is None:
             raise ValueError("No query type set")
+        return build_method(self, params)
 
-    def _build_select(self) -> str:
+    def _build_select(self, params: Optional[List[_Value]]) -> str:
         """Build SELECT query."""
-        parts = []
-
-        # SELECT columns
-        columns = ", ".join(self._select_columns) if self._select_columns else "*"
-        parts.append(f"SELECT {columns}")
+        # Fragments are collected with their separators and joined once
+        sql = ["SELECT ", ", ".join(self._select_columns) if self._select_columns else "*"]
 
         # FROM table
         if self._from_table:
-            parts.append(f"FROM {self._from_table}")
+            sql += (" FROM ", self._from_table)
 
         # JOINs
-        for join in self._joins:
-            parts.append(join)
+        if self._joins:
+            sql += (" ", " ".join(self._joins))
 
         # WHERE
-        if self._where_conditions:
-            where_clauses = [cond.to_sql() for cond in self._where_conditions]
-            parts.append(f"WHERE {' AND '.join(where_clauses)}")
+        self._append_where(sql, params)
 
         # GROUP BY
         if self._group_by_columns:
-            parts.append(f"GROUP BY {', '.join(self._group_by_columns)}")
+            sql += (" GROUP BY ", ", ".join(self._group_by_columns))
 
         # HAVING
         if self._having_clause:
-            parts.append(f"HAVING {self._having_clause}")
+            sql += (" HAVING ", self._having_clause)
 
         # ORDER BY
         if self._order_by_clauses:
-            parts.append(f"ORDER BY {', '.join(self._order_by_clauses)}")
+            sql += (" ORDER BY ", ", ".join(self._order_by_clauses))
 
         # LIMIT
         if self._limit_count is not None:
-            parts.append(f"LIMIT {self._limit_count}")
+            sql += (" LIMIT ", str(self._limit_count))
 
         # OFFSET
         if self._offset_count is not None:
-            parts.append(f"OFFSET {self._offset_count}")
+            sql += (" OFFSET ", str(self._offset_count))
 
-        return " ".join(parts)
+        return "".join(sql)
 
-    def _build_insert(self) -> str:
+    def _build_insert(self, params: Optional[List[_Value]]) -> str:
         """Build INSERT query."""
         if not self._insert_rows:
             raise ValueError("No values specified for INSERT")
 
-        first_row = self._insert_rows[0]
-        columns = list(first_row.keys())
-        columns_str = ", ".join(columns)
+        columns = list(self._insert_rows[0].keys())
 
         # Build values
-        values_lists = []
-        for row in self._insert_rows:
-            values = [self._format_value(row.get(col)) for col in columns]
-            values_lists.append(f"({', '.join(values)})")
-
-        values_str = ", ".join(values_lists)
-
-        return f"INSERT INTO {self._target_table} ({columns_str}) VALUES {values_str}"
-
-    def _build_update(self) -> str:
+        if params is not None:
+            for row in self._insert_rows:
+                params.extend([row.get(col) for col in columns])
+            row_str = ", ".join(["%s"] * len(columns))
+            values_str = "), (".join([row_str] * len(self._insert_rows))
+        else:
+            # Format column by column: a column usually holds one value type,
+            # so it can skip the per-value type dispatch
+            formatted = []
+            for col in columns:
+                values = [row.get(col) for row in self._insert_rows]
+                value_types = set(map(type, values))
+                if value_types <= _NUMERIC_TYPES:
+                    formatted.append(list(map(str, values)))
+                elif value_types == {str}:
+                    formatted.append(list(map(_quote_literal, cast(List[str], values))))
+                else:
+                    formatted.append(list(map(_format_value, values)))
+            values_str = "), (".join(map(", ".join, zip(*formatted)))
+
+        return "".join(
+            (
+                "INSERT INTO ",
+                cast(str, self._target_table),
+                " (",
+                ", ".join(columns),
+                ") VALUES (",
+                values_str,
+                ")",
+            )
+        )
+
+    def _build_update(self, params: Optional[List[_Value]]) -> str:
         """Build UPDATE query."""
         if not self._set_data:
             raise ValueError("No SET data specified for UPDATE")
 
         # SET clause
-        set_clauses = [
-            f"{field} = {self._format_value(value)}"
-            for field, value in self._set_data.items()
-        ]
-        set_str = ", ".join(set_clauses)
-
-        parts = [f"UPDATE {self._target_table}", f"SET {set_str}"]
-
-        # WHERE
-        if self._where_conditions:
-            where_clauses = [cond.to_sql() for cond in self._where_conditions]
-            parts.append(f"WHERE {' AND '.join(where_clauses)}")
+        if params is not None:
+            params.extend(self._set_data.values())
+            set_str = ", ".join([field + " = %s" for field in self._set_data])
+        else:
+            set_str = ", ".join(
+                [field + " = " + _format_value(value) for field, value in self._set_data.items()]
+            )
 
-        return " ".join(parts)
+        sql = ["UPDATE ", cast(str, self._target_table), " SET ", set_str]
+        self._append_where(sql, params)
+        return "".join(sql)
 
-    def _build_delete(self) -> str:
+    def _build_delete(self, params: Optional[List[_Value]]) -> str:
         """Build DELETE query."""
-        parts = [f"DELETE FROM {self._target_table}"]
+        sql = ["DELETE FROM ", cast(str, self._target_table)]
+        self._append_where(sql, params)
+        return "".join(sql)
 
-        # WHERE
+    def _append_where(self, sql: List[str], params: Optional[List[_Value]]) -> None:
+        """Append the WHERE clause, if any, to a list of SQL fragments."""
         if self._where_conditions:
-            where_clauses = [cond.to_sql() for cond in self._where_conditions]
-            parts.append(f"WHERE {' AND '.join(where_clauses)}")
-
-        return " ".join(parts)
-
-    def _format_value(self, value: DatabaseValue) -> str:
-        """Format value for SQL."""
-        if value is None:
-            return "NULL"
-        elif isinstance(value, str):
-            # Escape single quotes
-            escaped = value.replace("'", "''")
-            return f"'{escaped}'"
-        elif isinstance(value, bool):
-            return "TRUE" if value else "FALSE"
-        else:
-            return str(value)
+            sql += (
+                " WHERE ",
+                " AND ".join([cond.to_sql(params) for cond in self._where_conditions]),
+            )
 
     # Reset builder
 
     def reset(self) -> None:
-        """Reset builder to initial state."""
+        """Reset builder to initial state, reusing its containers."""
         self._query_type = None
-        self._select_columns = []
+        self._select_columns.clear()
         self._from_table = None
-        self._where_conditions = []
-        self._joins = []
-        self._group_by_columns = []
+        self._where_conditions.clear()
+        self._joins.clear()
+        self._group_by_columns.clear()
         self._having_clause = None
-        self._order_by_clauses = []
+        self._order_by_clauses.clear()
         self._limit_count = None
         self._offset_count = None
         self._target_table = None
-        self._set_data = {}
-        self._insert_rows = []
+        self._set_data.clear()
+        self._insert_rows.clear()
+
+
+# Query type -> build method
+_BUILDERS: Dict[Optional[str], Callable[[QueryBuilder, Optional[List[_Value]]], str]] = {
+    "SELECT": QueryBuilder._build_select,
+    "INSERT": QueryBuilder._build_insert,
+    "UPDATE": QueryBuilder._build_update,
+    "DELETE": QueryBuilder._build_delete,
+}
@@ -101,10 +101,8 @@ def main():
             print("✗ Failed to retrieve users")
 
         # Select specific user
-        select_user = (
-            "SELECT username, email, age FROM users WHERE username = 'john_doe'"
-        )
-        john_data = db_manager.select_query(select_user)
+        select_user = "SELECT username, email, age FROM users WHERE username = %s"
+        john_data = db_manager.select_query(select_user, ("john_doe",))
 
         if john_data:
             print("✓ John's data retrieved:")
@@ -0,0 +1,258 @@
+"""
+Tests for ConnectionPool acquire/release behaviour.
+
+Connections come from a fake factory, so no database is needed.
+"""
+
+import threading
+import time
+
+import pytest
+
+from database_module.pool import ConnectionPool, ConnectionPoolConfig
+
+
+class FakeConnection:
+    """Stand-in connection that records whether it was closed."""
+
+    def __init__(self, number: int):
+        self.number = number
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeFactory:
+    """Connection factory handing out numbered FakeConnections."""
+
+    def __init__(self):
+        self.created = []
+        self._lock = threading.Lock()
+
+    def __call__(self) -> FakeConnection:
+        with self._lock:
+            conn = FakeConnection(len(self.created))
+            self.created.append(conn)
+        return conn
+
+
+def make_pool(factory=None, validate=None, reset=None, **overrides) -> ConnectionPool:
+    """Create a pool with no pre-created connections and no health checks."""
+    options = dict(min_connections=0, max_connections=1, enable_health_checks=False)
+    options.update(overrides)
+    return ConnectionPool(
+        ConnectionPoolConfig(**options), factory or FakeFactory(), validate, reset
+    )
+
+
+def wait_for(predicate, timeout: float = 2.0) -> None:
+    """Poll until predicate() is true, failing the test on timeout."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            pytest.fail("condition not reached in time")
+        time.sleep(0.001)
+
+
+def start_acquirer(pool: ConnectionPool, results: dict, name: str, timeout: float = 2.0):
+    """Run pool.acquire() in a new thread, storing the result under name."""
+    thread = threading.Thread(
+        target=lambda: results.__setitem__(name, pool.acquire(timeout=timeout))
+    )
+    thread.start()
+    return thread
+
+
+def test_release_hands_connection_to_waiters_in_fifo_order():
+    pool = make_pool()
+    conn = pool.acquire()
+    results = {}
+
+    first = start_acquirer(pool, results, "first")
+    wait_for(lambda: len(pool._waiters) == 1)
+    second = start_acquirer(pool, results, "second")
+    wait_for(lambda: len(pool._waiters) == 2)
+
+    pool.release(conn)
+    first.join()
+    assert results["first"] is conn
+    # A late acquirer cannot overtake the thread still waiting
+    assert pool.acquire(timeout=0.01) is None
+    assert "second" not in results
+
+    pool.release(results["first"])
+    second.join()
+    assert results["second"] is conn
+    assert pool.get_stats().successful_acquisitions == 3
+
+
+def test_acquire_times_out_when_pool_is_exhausted():
+    pool = make_pool()
+    conn = pool.acquire()
+
+    started = time.monotonic()
+    assert pool.acquire(timeout=0.05) is None
+    assert time.monotonic() - started >= 0.05
+
+    stats = pool.get_stats()
+    assert stats.failed_acquisitions == 1
+    assert stats.successful_acquisitions == 1
+    assert not pool._waiters
+
+    # The timed-out waiter must not swallow the next release
+    pool.release(conn)
+    assert pool.acquire(timeout=0.05) is conn
+
+
+def test_discarding_stale_connection_wakes_waiter():
+    factory = FakeFactory()
+    pool = make_pool(factory)
+    stale = pool.acquire()
+    results = {}
+
+    waiter = start_acquirer(pool, results, "waiter")
+    wait_for(lambda: len(pool._waiters) == 1)
+
+    # What acquire() does with a connection that fails validation: the
+    # freed capacity goes to the waiter, which creates a new connection
+    pool._discard(stale)
+    waiter.join()
+
+    assert stale.closed
+    assert results["waiter"] is factory.created[1]
+    assert pool.size() == 1
+    assert pool.get_stats().successful_acquisitions == 1
+
+
+def test_failed_connection_attempt_wakes_waiter():
+    factory = FakeFactory()
+    gate = threading.Event()
+    attempting = threading.Event()
+
+    def flaky_factory():
+        # The second connection attempt stalls, then fails
+        if len(factory.created) == 1 and not attempting.is_set():
+            attempting.set()
+            gate.wait()
+            return None
+        return factory()
+
+    pool = make_pool(flaky_factory, max_connections=2)
+    held = pool.acquire()
+    results = {}
+
+    failing = start_acquirer(pool, results, "failing", timeout=3.0)
+    attempting.wait()
+    waiter = start_acquirer(pool, results, "waiter", timeout=3.0)
+    wait_for(lambda: len(pool._waiters) == 1)
+
+    started = time.monotonic()
+    gate.set()
+    failing.join()
+    waiter.join()
+
+    # The failing thread gives up at once and its slot goes to the waiter
+    assert time.monotonic() - started < 1.0
+    assert results["failing"] is None
+    assert results["waiter"] is factory.created[1]
+    assert pool.size() == 2
+    stats = pool.get_stats()
+    assert stats.failed_acquisitions == 1
+    assert stats.successful_acquisitions == 2
+    pool.release(held)
+
+
+def test_acquire_replaces_connection_failing_validation():
+    factory = FakeFactory()
+    pool = make_pool(factory, validate=lambda conn: not conn.closed, idle_timeout_seconds=0)
+    stale = pool.acquire()
+    pool.release(stale)
+    stale.closed = True
+
+    conn = pool.acquire()
+    assert conn is factory.created[1]
+    assert pool.size() == 1
+    assert pool.get_stats().successful_acquisitions == 2
+
+
+@pytest.mark.parametrize("thread_local_cache", [False, True])
+def test_release_resets_connection(thread_local_cache):
+    reset = []
+    pool = make_pool(
+        reset=lambda conn: reset.append(conn) or True, thread_local_cache=thread_local_cache
+    )
+    conn = pool.acquire()
+    pool.release(conn)
+
+    assert reset == [conn]
+    assert pool.acquire() is conn
+
+
+def test_connection_failing_reset_is_dropped():
+    factory = FakeFactory()
+    pool = make_pool(factory, reset=lambda conn: False)
+    conn = pool.acquire()
+    pool.release(conn)
+
+    assert conn.closed
+    assert pool.size() == 0
+    assert pool.acquire() is factory.created[1]
+
+
+@pytest.mark.parametrize("thread_local_cache", [False, True])
+def test_double_release_does_not_share_connection(thread_local_cache):
+    pool = make_pool(max_connections=2, thread_local_cache=thread_local_cache)
+    conn = pool.acquire()
+    pool.release(conn)
+    pool.release(conn)
+
+    first = pool.acquire()
+    second = pool.acquire()
+    assert first is not second
+    assert pool.in_use_count() == 2
+
+
+def test_release_of_foreign_connection_is_ignored():
+    pool = make_pool(thread_local_cache=True)
+    pool.release(FakeConnection(-1))
+
+    assert pool.available_count() == 0
+    assert pool.acquire() is not None
+
+
+@pytest.mark.parametrize(
+    "thread_local_cache, threads, max_connections",
+    [(False, 8, 3), (True, 4, 4)],
+)
+def test_stats_totals_under_threads(thread_local_cache, threads, max_connections):
+    rounds = 200
+    pool = make_pool(
+        max_connections=max_connections,
+        thread_local_cache=thread_local_cache,
+        acquire_timeout_seconds=10.0,
+    )
+    errors = []
+
+    def worker():
+        for _ in range(rounds):
+            conn = pool.acquire()
+            if conn is None:
+                errors.append("timed out")
+                return
+            pool.release(conn)
+        pool.flush_thread_cache()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    assert not errors
+    stats = pool.get_stats()
+    assert stats.successful_acquisitions == threads * rounds
+    assert stats.failed_acquisitions == 0
+    assert stats.active_connections == 0
+    assert stats.total_connections <= max_connections
+    assert stats.available_connections == stats.total_connections
@@ -0,0 +1,265 @@
+"""
+Tests for PostgresManager's prepared statement cache.
+
+A fake cursor records the SQL sent to the server, so no database is needed.
+"""
+
+from collections import namedtuple
+
+import pytest
+
+errors = pytest.importorskip("psycopg2.errors")
+
+from database_module.backends.postgres.postgres_manager import PostgresManager, _copy_text
+
+Column = namedtuple("Column", "name")
+
+
+class FakeCursor:
+    """Cursor recording executed statements and failing on demand."""
+
+    def __init__(self):
+        self.executed = []
+        # (SQL prefix, exception) pairs, each raised once by a matching execute
+        self.failures = []
+        self.description = [Column("id")]
+        self.rowcount = 1
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+        for failure in self.failures:
+            prefix, error = failure
+            if query.startswith(prefix):
+                self.failures.remove(failure)
+                raise error
+
+    def fetchall(self):
+        return [(1,)]
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """Connection counting commits and rollbacks."""
+
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def manager():
+    manager = PostgresManager()
+    manager._connection = FakeConnection()
+    manager._cursor = FakeCursor()
+    return manager
+
+
+def sent(manager):
+    """SQL statements sent so far."""
+    return [query for query, _ in manager._cursor.executed]
+
+
+def test_multi_statement_query_bypasses_cache(manager):
+    query = "INSERT INTO log (msg) VALUES (%s); UPDATE counters SET n = n + 1"
+    for _ in range(2):
+        manager.insert_query(query, ("hi",))
+
+    assert sent(manager) == [query, query]
+    assert not manager._stmt_cache
+
+
+def test_trailing_semicolon_is_still_prepared(manager):
+    manager.insert_query("INSERT INTO log (msg) VALUES (%s);", ("hi",))
+
+    assert sent(manager) == [
+        "SAVEPOINT ps_1; PREPARE ps_1 AS INSERT INTO log (msg) VALUES ($1); "
+        "RELEASE SAVEPOINT ps_1",
+        "EXECUTE ps_1 (%s)",
+    ]
+
+
+def test_result_type_change_is_retried_with_autocommit(manager):
+    query = "SELECT * FROM t WHERE id = %s"
+    manager.select_query(query, (1,))
+    manager._cursor.failures.append(
+        ("EXECUTE", errors.FeatureNotSupported("cached plan must not change result type"))
+    )
+
+    assert manager.select_query(query, (1,)) == [{"id": 1}]
+    assert manager._connection.rollbacks == 1
+    assert sent(manager)[-3:] == [
+        "SAVEPOINT ps_1; DEALLOCATE ps_1; RELEASE SAVEPOINT ps_1",
+        "SAVEPOINT ps_2; PREPARE ps_2 AS SELECT * FROM t WHERE id = $1; RELEASE SAVEPOINT ps_2",
+        "EXECUTE ps_2 (%s)",
+    ]
+
+
+def test_dropped_statement_is_retried_with_autocommit(manager):
+    query = "UPDATE t SET n = %s"
+    manager.update_query(query, (1,))
+    manager._cursor.failures.append(
+        ("EXECUTE", errors.InvalidSqlStatementName("prepared statement does not exist"))
+    )
+
+    assert manager.update_query(query, (2,)) == 1
+    assert sent(manager)[-2:] == [
+        "SAVEPOINT ps_2; PREPARE ps_2 AS UPDATE t SET n = $1; RELEASE SAVEPOINT ps_2",
+        "EXECUTE ps_2 (%s)",
+    ]
+
+
+def test_invalidated_statement_is_not_retried_inside_transaction(manager):
+    query = "SELECT * FROM t WHERE id = %s"
+    manager.set_autocommit(False)
+    manager.select_query(query, (1,))
+    manager._cursor.failures.append(
+        ("EXECUTE", errors.FeatureNotSupported("cached plan must not change result type"))
+    )
+
+    # Retrying would hide that the open transaction was aborted
+    assert manager.select_query(query, (1,)) == []
+    assert query not in manager._stmt_cache
+    assert manager._stale_statements == ["ps_1"]
+
+
+def test_eviction_tolerates_statement_gone_server_side(manager):
+    manager._statement_cache_size = 1
+    manager.update_query("UPDATE t SET a = %s", (1,))
+    manager._cursor.failures.append(
+        ("SAVEPOINT ps_1; DEALLOCATE", errors.InvalidSqlStatementName("ps_1 does not exist"))
+    )
+
+    assert manager.update_query("UPDATE t SET b = %s", (1,)) == 1
+    assert sent(manager)[-4:] == [
+        "SAVEPOINT ps_1; DEALLOCATE ps_1; RELEASE SAVEPOINT ps_1",
+        "ROLLBACK TO SAVEPOINT ps_1; RELEASE SAVEPOINT ps_1",
+        "SAVEPOINT ps_2; PREPARE ps_2 AS UPDATE t SET b = $1; RELEASE SAVEPOINT ps_2",
+        "EXECUTE ps_2 (%s)",
+    ]
+    assert list(manager._stmt_cache) == ["UPDATE t SET b = %s"]
+
+
+def test_repeated_query_is_prepared_once(manager):
+    query = "SELECT * FROM t WHERE id = %s AND name LIKE 'a%%'"
+    for value in (1, 2):
+        assert manager.select_query(query, (value,)) == [{"id": 1}]
+
+    assert manager._cursor.executed == [
+        (
+            "SAVEPOINT ps_1; PREPARE ps_1 AS SELECT * FROM t WHERE id = $1 AND name LIKE 'a%'; "
+            "RELEASE SAVEPOINT ps_1",
+            None,
+        ),
+        ("EXECUTE ps_1 (%s)", (1,)),
+        ("EXECUTE ps_1 (%s)", (2,)),
+    ]
+
+
+@pytest.mark.parametrize(
+    "query, params",
+    [
+        ("SELECT * FROM t WHERE id IN %s", ((1, 2),)),
+        ("SELECT * FROM t WHERE id = %(id)s", {"id": 1}),
+        ("SELECT * FROM t", None),
+    ],
+)
+def test_non_scalar_or_missing_params_bypass_cache(manager, query, params):
+    manager.select_query(query, params)
+
+    assert manager._cursor.executed == [(query, params)]
+    assert not manager._stmt_cache
+
+
+def test_disabled_cache_runs_queries_unprepared():
+    manager = PostgresManager(statement_cache_size=0)
+    manager._connection = FakeConnection()
+    manager._cursor = FakeCursor()
+    manager.select_query("SELECT * FROM t WHERE id = %s", (1,))
+
+    assert sent(manager) == ["SELECT * FROM t WHERE id = %s"]
+
+
+def test_failed_prepare_rolls_back_savepoint_and_runs_unprepared(manager):
+    query = "SELECT %s::unknown_type"
+    manager._cursor.failures.append(("SAVEPOINT ps_1", errors.UndefinedObject("no such type")))
+    for _ in range(2):
+        manager.select_query(query, (1,))
+
+    assert sent(manager) == [
+        "SAVEPOINT ps_1; PREPARE ps_1 AS SELECT $1::unknown_type; RELEASE SAVEPOINT ps_1",
+        "ROLLBACK TO SAVEPOINT ps_1; RELEASE SAVEPOINT ps_1",
+        query,
+        query,
+    ]
+    assert manager._connection.rollbacks == 0
+
+
+def test_duplicate_prepared_statement_is_retried_with_fresh_name(manager):
+    query = "UPDATE t SET a = %s"
+    manager._cursor.failures.append(
+        ("SAVEPOINT ps_1", errors.DuplicatePreparedStatement("ps_1 already exists"))
+    )
+    for _ in range(2):
+        assert manager.update_query(query, (1,)) == 1
+
+    assert sent(manager) == [
+        "SAVEPOINT ps_1; PREPARE ps_1 AS UPDATE t SET a = $1; RELEASE SAVEPOINT ps_1",
+        "ROLLBACK TO SAVEPOINT ps_1; RELEASE SAVEPOINT ps_1",
+        query,
+        "SAVEPOINT ps_2; PREPARE ps_2 AS UPDATE t SET a = $1; RELEASE SAVEPOINT ps_2",
+        "EXECUTE ps_2 (%s)",
+    ]
+
+
+def test_stale_statement_is_deallocated_before_next_prepare(manager):
+    query = "SELECT * FROM t WHERE id = %s"
+    manager.set_autocommit(False)
+    manager.select_query(query, (1,))
+    manager._cursor.failures.append(
+        ("EXECUTE", errors.FeatureNotSupported("cached plan must not change result type"))
+    )
+    manager.select_query(query, (1,))
+
+    assert manager.select_query(query, (1,)) == [{"id": 1}]
+    assert sent(manager)[-3:] == [
+        "SAVEPOINT ps_1; DEALLOCATE ps_1; RELEASE SAVEPOINT ps_1",
+        "SAVEPOINT ps_2; PREPARE ps_2 AS SELECT * FROM t WHERE id = $1; RELEASE SAVEPOINT ps_2",
+        "EXECUTE ps_2 (%s)",
+    ]
+    assert not manager._stale_statements
+
+
+def test_least_recently_used_statement_is_evicted(manager):
+    manager._statement_cache_size = 2
+    for column in ("a", "b", "a", "c"):
+        manager.update_query(f"UPDATE t SET {column} = %s", (1,))
+
+    assert list(manager._stmt_cache) == ["UPDATE t SET a = %s", "UPDATE t SET c = %s"]
+    assert "SAVEPOINT ps_2; DEALLOCATE ps_2; RELEASE SAVEPOINT ps_2" in sent(manager)
+
+
+@pytest.mark.parametrize(
+    "value, field",
+    [
+        (None, "\\N"),
+        (True, "t"),
+        (False, "f"),
+        (12, "12"),
+        ("a\tb\\c\nd", "a\\tb\\\\c\\nd"),
+        (b"\x00\xff", "\\\\x00ff"),
+        (bytearray(b"ab"), "\\\\x6162"),
+    ],
+)
+def test_copy_text_encoding(value, field):
+    assert _copy_text(value) == field
@@ -0,0 +1,144 @@
+"""
+Tests for QueryBuilder SQL generation.
+
+Expected build() output matches the original builder; build_parameterized()
+must produce the same statement with values moved into params.
+"""
+
+import pytest
+
+from database_module.query import QueryBuilder, QueryCondition, SortOrder
+
+
+def test_nested_conditions_keep_placeholder_and_param_order():
+    condition = (QueryCondition("b", "=", "x") | QueryCondition("c", ">", 2)) & QueryCondition(
+        raw_condition="deleted IS NULL"
+    )
+    builder = (
+        QueryBuilder()
+        .select(["id", "name"])
+        .from_table("users")
+        .where("a", "=", 1)
+        .where_condition(condition)
+        .where_raw("e < 5")
+        .where("f", "=", None)
+    )
+
+    assert builder.build() == (
+        "SELECT id, name FROM users WHERE a = 1 AND ((b = 'x' OR c > 2) "
+        "AND deleted IS NULL) AND e < 5 AND f = NULL"
+    )
+    assert builder.build_parameterized() == (
+        "SELECT id, name FROM users WHERE a = %s AND ((b = %s OR c > %s) "
+        "AND deleted IS NULL) AND e < 5 AND f = %s",
+        [1, "x", 2, None],
+    )
+
+
+def test_select_clauses():
+    builder = (
+        QueryBuilder()
+        .select("*")
+        .from_table("t")
+        .join("o", "o.id = t.oid")
+        .left_join("p", "p.id = t.pid")
+        .group_by(["a", "b"])
+        .having("COUNT(*) > 1")
+        .order_by("a", SortOrder.DESC)
+        .order_by("b")
+        .limit(10)
+        .offset(20)
+    )
+
+    assert builder.build() == (
+        "SELECT * FROM t INNER JOIN o ON o.id = t.oid LEFT JOIN p ON p.id = t.pid "
+        "GROUP BY a, b HAVING COUNT(*) > 1 ORDER BY a DESC, b ASC LIMIT 10 OFFSET 20"
+    )
+
+
+def test_insert_rows_with_missing_keys_use_null():
+    builder = (
+        QueryBuilder()
+        .insert_into("t")
+        .values([{"a": 1, "b": "x"}, {"a": 2}, {"b": "it's", "a": 3}])
+    )
+
+    assert builder.build() == "INSERT INTO t (a, b) VALUES (1, 'x'), (2, NULL), (3, 'it''s')"
+    assert builder.build_parameterized() == (
+        "INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s), (%s, %s)",
+        [1, "x", 2, None, 3, "it's"],
+    )
+
+
+def test_insert_mixed_type_columns():
+    builder = (
+        QueryBuilder()
+        .insert_into("t")
+        .values(
+            [
+                {"a": 1, "b": "x", "c": None},
+                {"a": 2.5, "b": None, "c": True},
+                {"a": "s", "b": "o'k", "c": False},
+            ]
+        )
+    )
+
+    assert builder.build() == (
+        "INSERT INTO t (a, b, c) VALUES (1, 'x', NULL), (2.5, NULL, TRUE), ('s', 'o''k', FALSE)"
+    )
+    assert builder.build_parameterized()[1] == [1, "x", None, 2.5, None, True, "s", "o'k", False]
+
+
+def test_update_with_where():
+    builder = (
+        QueryBuilder()
+        .update("users")
+        .set({"email": "e@x"})
+        .set("n", 3)
+        .where("id", "=", 7)
+        .where("ok", "=", True)
+    )
+
+    assert builder.build() == "UPDATE users SET email = 'e@x', n = 3 WHERE id = 7 AND ok = TRUE"
+    assert builder.build_parameterized() == (
+        "UPDATE users SET email = %s, n = %s WHERE id = %s AND ok = %s",
+        ["e@x", 3, 7, True],
+    )
+
+
+def test_delete_with_and_without_where():
+    assert (
+        QueryBuilder().delete_from("users").where("age", "<", 18).build()
+        == "DELETE FROM users WHERE age < 18"
+    )
+    assert QueryBuilder().delete_from("users").build_parameterized() == ("DELETE FROM users", [])
+
+
+def test_reset_clears_previous_query():
+    builder = QueryBuilder().select("a").from_table("t").where("a", "=", 1).limit(1)
+    builder.build()
+    builder.reset()
+
+    assert builder.select("b").from_table("u").build() == "SELECT b FROM u"
+
+
+def test_build_sees_conditions_mutated_after_adding():
+    condition = QueryCondition("a", "=", 1)
+    builder = QueryBuilder().select("*").from_table("t").where_condition(condition)
+    builder.build()
+    condition.value = 2
+
+    assert builder.build() == "SELECT * FROM t WHERE a = 2"
+
+
+@pytest.mark.parametrize(
+    "builder, message",
+    [
+        (QueryBuilder(), "No query type set"),
+        (QueryBuilder().insert_into("t"), "No values specified for INSERT"),
+        (QueryBuilder().update("t"), "No SET data specified for UPDATE"),
+    ],
+)
+def test_incomplete_queries_raise(builder, message):
+    with pytest.raises(ValueError, match=message):
+        builder.build()